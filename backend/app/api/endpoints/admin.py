@@ -1,6 +1,10 @@
 """Admin endpoints for managing leads and system."""
 
-from fastapi import APIRouter, HTTPException, Depends, status
+import asyncio
+from datetime import datetime
+from uuid import UUID
+import asyncpg
+from fastapi import APIRouter, HTTPException, Depends, Query, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from typing import Optional
 
@@ -8,8 +12,10 @@ from app.schemas.admin import LoginRequest, TokenResponse, AdminResponse
 from app.schemas.leads import LeadListResponse, LeadResponse, LeadUpdate
 from app.schemas.common import ResponseMessage
 from app.services.lead_service import LeadService
-from app.core.security import create_access_token, decode_access_token
+from app.core.security import create_access_token, decode_access_token, verify_password
 from app.core.database import get_database
+from app.core.cache import cache_get, cache_set, cache_delete
+from app.core.config import settings
 from app.models.leads import LeadStatus, LeadSource
 
 router = APIRouter()
@@ -31,9 +37,19 @@ async def get_current_admin(
                 detail="Invalid authentication credentials"
             )
         
+        # Serve the admin row from cache when possible
+        cache_key = f"admin:{admin_id}"
+        cached_admin = await cache_get(cache_key)
+        if cached_admin is not None:
+            return cached_admin
+        
         # Verify admin exists and is active
-        query = "SELECT * FROM admins WHERE id = :admin_id AND is_active = true"
-        admin = await db.fetch_one(query=query, values={"admin_id": admin_id})
+        query = """
+            SELECT id, email, username, full_name, is_active, is_superuser, created_at, last_login
+            FROM admins
+            WHERE id = $1 AND is_active = true
+        """
+        admin = await db.fetchrow(query, admin_id)
         
         if not admin:
             raise HTTPException(
@@ -41,7 +57,10 @@ async def get_current_admin(
                 detail="Admin user not found or inactive"
             )
         
-        return dict(admin)
+        admin = dict(admin)
+        await cache_set(cache_key, admin, ttl=settings.ADMIN_CACHE_TTL)
+        
+        return admin
         
     except HTTPException:
         raise
@@ -60,8 +79,8 @@ async def admin_login(
     """Admin login endpoint."""
     try:
         # Get admin by username
-        query = "SELECT * FROM admins WHERE username = :username AND is_active = true"
-        admin = await db.fetch_one(query=query, values={"username": login_data.username})
+        query = "SELECT id, hashed_password FROM admins WHERE username = $1 AND is_active = true"
+        admin = await db.fetchrow(query, login_data.username)
         
         if not admin:
             raise HTTPException(
@@ -69,20 +88,22 @@ async def admin_login(
                 detail="Invalid username or password"
             )
         
-        # Verify password (you would implement password verification here)
-        # For now, we'll use a simple check - implement proper bcrypt verification
-        from app.core.security import verify_password
+        # Verify password off the event loop; bcrypt is deliberately slow
+        password_ok = await asyncio.to_thread(
+            verify_password, login_data.password, admin["hashed_password"]
+        )
         
-        if not verify_password(login_data.password, admin["hashed_password"]):
+        if not password_ok:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid username or password"
             )
         
-        # Update last login
-        await db.execute(
-            "UPDATE admins SET last_login = CURRENT_TIMESTAMP WHERE id = :admin_id",
-            values={"admin_id": admin["id"]}
+        # Update last login and drop the cached admin row concurrently; at
+        # worst a racing request re-caches the old last_login for one TTL
+        await asyncio.gather(
+            db.execute("UPDATE admins SET last_login = CURRENT_TIMESTAMP WHERE id = $1", admin["id"]),
+            cache_delete(f"admin:{admin['id']}"),
         )
         
         # Create access token
@@ -104,29 +125,44 @@ async def get_current_admin_info(
     current_admin = Depends(get_current_admin)
 ):
     """Get current admin user information."""
-    return AdminResponse(**current_admin)
+    return current_admin
 
 
 @router.get("/leads", response_model=LeadListResponse)
 async def get_leads(
-    skip: int = 0,
-    limit: int = 50,
+    skip: int = Query(0, ge=0, le=10000),  # Deeper pages should use the cursor
+    limit: int = Query(
+        50, ge=1, description=f"Page size; values above {LeadService.MAX_PAGE_SIZE} are clamped to it"
+    ),
     status: Optional[LeadStatus] = None,
     source: Optional[LeadSource] = None,
+    cursor_created_at: Optional[datetime] = None,
+    cursor_id: Optional[UUID] = None,
+    include_total: bool = True,
     current_admin = Depends(get_current_admin),
     db = Depends(get_database)
 ):
-    """Get paginated list of leads with optional filters."""
+    """
+    Get paginated list of leads with optional filters.
+    
+    Pass next_cursor from the previous page as cursor_created_at and
+    cursor_id to fetch the following page; skip is ignored when set.
+    Set include_total=false to skip counting all matching leads.
+    """
     try:
         lead_service = LeadService(db)
         result = await lead_service.get_leads(
             skip=skip,
-            limit=min(limit, 100),  # Cap at 100 per page
+            limit=min(limit, LeadService.MAX_PAGE_SIZE),  # Clamp rather than reject larger pages
             status=status,
-            source=source
+            source=source,
+            cursor_created_at=cursor_created_at,
+            cursor_id=cursor_id,
+            include_total=include_total
         )
         
-        return LeadListResponse(**result)
+        # response_model validates the rows once; no intermediate models
+        return result
         
     except Exception as e:
         raise HTTPException(
@@ -152,7 +188,7 @@ async def get_lead(
                 detail="Lead not found"
             )
         
-        return LeadResponse(**lead)
+        return lead
         
     except HTTPException:
         raise
@@ -172,65 +208,25 @@ async def update_lead(
 ):
     """Update lead information."""
     try:
-        lead_service = LeadService(db)
-        
-        # Check if lead exists
-        existing_lead = await lead_service.get_lead_by_id(lead_id)
-        if not existing_lead:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Lead not found"
-            )
-        
-        # Build update query dynamically
-        update_fields = []
-        values = {"lead_id": lead_id, "updated_at": "CURRENT_TIMESTAMP"}
-        
-        if lead_update.name is not None:
-            update_fields.append("name = :name")
-            values["name"] = lead_update.name
-        
-        if lead_update.email is not None:
-            update_fields.append("email = :email")
-            values["email"] = lead_update.email
-        
-        if lead_update.phone is not None:
-            update_fields.append("phone = :phone")
-            values["phone"] = lead_update.phone
-        
-        if lead_update.company is not None:
-            update_fields.append("company = :company")
-            values["company"] = lead_update.company
-        
-        if lead_update.role is not None:
-            update_fields.append("role = :role")
-            values["role"] = lead_update.role
-        
-        if lead_update.purpose is not None:
-            update_fields.append("purpose = :purpose")
-            values["purpose"] = lead_update.purpose
+        updates = lead_update.model_dump(exclude_none=True)
         
-        if lead_update.status is not None:
-            update_fields.append("status = :status")
-            values["status"] = lead_update.status.value
-        
-        if lead_update.notes is not None:
-            update_fields.append("notes = :notes")
-            values["notes"] = lead_update.notes
-        
-        if not update_fields:
+        if not updates:
             return ResponseMessage(
                 success=True,
                 message="No changes to update"
             )
         
-        update_query = f"""
-            UPDATE leads 
-            SET {', '.join(update_fields)}, updated_at = CURRENT_TIMESTAMP
-            WHERE id = :lead_id
-        """
+        if lead_update.status is not None:
+            updates["status"] = lead_update.status.value
         
-        await db.execute(query=update_query, values=values)
+        lead_service = LeadService(db)
+        updated = await lead_service.update_lead(lead_id, updates)
+        
+        if not updated:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Lead not found"
+            )
         
         return ResponseMessage(
             success=True,
@@ -239,6 +235,12 @@ async def update_lead(
         
     except HTTPException:
         raise
+    except asyncpg.UniqueViolationError:
+        # leads_email_idx: another lead already uses this email
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A lead with this email already exists"
+        )
     except Exception:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -254,22 +256,16 @@ async def delete_lead(
 ):
     """Delete a lead (GDPR compliance)."""
     try:
-        # Check if lead exists
+        # Delete lead and related data
         lead_service = LeadService(db)
-        existing_lead = await lead_service.get_lead_by_id(lead_id)
+        deleted = await lead_service.delete_lead(lead_id)
         
-        if not existing_lead:
+        if not deleted:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Lead not found"
             )
         
-        # Delete lead and related data
-        await db.execute(
-            "DELETE FROM leads WHERE id = :lead_id",
-            values={"lead_id": lead_id}
-        )
-        
         return ResponseMessage(
             success=True,
             message="Lead deleted successfully"
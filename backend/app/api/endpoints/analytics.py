@@ -1,12 +1,14 @@
 """Analytics and metrics endpoints."""
 
 from datetime import datetime, timedelta
-from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
 from typing import Optional, Dict, Any
 
 from app.schemas.common import AnalyticsResponse
 from app.api.endpoints.admin import get_current_admin
 from app.core.database import get_database
+from app.core.cache import analytics_cache_key, cache_get_raw, cache_set_raw
+from app.core.config import settings
 
 router = APIRouter()
 
@@ -28,188 +30,135 @@ async def get_dashboard_analytics(
     - Time-based trends
     """
     try:
+        # Dashboards poll frequently; serve recent results from cache
+        cache_key = await analytics_cache_key(days)
+        cached = await cache_get_raw(cache_key)
+        if cached is not None:
+            return Response(content=cached, media_type="application/json")
+        
         end_date = datetime.utcnow()
         start_date = end_date - timedelta(days=days)
         
-        # Portfolio metrics query
-        portfolio_query = """
-            SELECT 
-                COUNT(*) as total_requests,
-                COUNT(CASE WHEN created_at >= :start_date THEN 1 END) as period_requests,
-                COUNT(CASE WHEN status = 'qualified' THEN 1 END) as qualified_leads,
-                COUNT(CASE WHEN status IN ('proposal_sent', 'closed_won') THEN 1 END) as converted_leads,
-                COUNT(CASE WHEN source = 'cv_request' THEN 1 END) as cv_requests,
-                COUNT(CASE WHEN source = 'calendly' THEN 1 END) as calendly_bookings,
-                COUNT(CASE WHEN source = 'linkedin' THEN 1 END) as linkedin_leads,
-                COUNT(DISTINCT email) as unique_contacts,
-                COUNT(CASE WHEN company IS NOT NULL AND company != '' THEN 1 END) as with_company
-            FROM leads 
-            WHERE created_at >= :start_date
-        """
-        
-        portfolio_result = await db.fetch_one(
-            query=portfolio_query,
-            values={"start_date": start_date}
-        )
-        
-        # Lead quality analysis
-        quality_query = """
-            SELECT 
-                company,
-                role,
-                status,
-                COUNT(*) as count
-            FROM leads 
-            WHERE created_at >= :start_date
-                AND company IS NOT NULL 
-                AND company != ''
-            GROUP BY company, role, status
-            ORDER BY count DESC
-        """
-        
-        quality_results = await db.fetch_all(
-            query=quality_query,
-            values={"start_date": start_date}
-        )
-        
-        # Time-based trends
-        trends_query = """
-            SELECT 
-                DATE_TRUNC('day', created_at) as date,
-                COUNT(*) as daily_requests,
-                COUNT(CASE WHEN source = 'cv_request' THEN 1 END) as cv_requests,
-                COUNT(CASE WHEN source = 'calendly' THEN 1 END) as calendly_bookings
-            FROM leads 
-            WHERE created_at >= :start_date
-            GROUP BY DATE_TRUNC('day', created_at)
-            ORDER BY date DESC
-            LIMIT 30
-        """
-        
-        trends_results = await db.fetch_all(
-            query=trends_query,
-            values={"start_date": start_date}
-        )
-        
-        # Source attribution
-        source_query = """
-            SELECT 
-                source,
-                COUNT(*) as count,
-                ROUND(COUNT(*) * 100.0 / SUM(COUNT(*)) OVER (), 2) as percentage
-            FROM leads 
-            WHERE created_at >= :start_date
-            GROUP BY source
-            ORDER BY count DESC
-        """
-        
-        source_results = await db.fetch_all(
-            query=source_query,
-            values={"start_date": start_date}
-        )
-        
-        # Company types analysis
-        company_types_query = """
-            SELECT 
-                CASE 
-                    WHEN LOWER(company) LIKE '%startup%' OR LOWER(company) LIKE '%inc%' THEN 'startup'
-                    WHEN LOWER(company) LIKE '%corp%' OR LOWER(company) LIKE '%ltd%' OR LOWER(company) LIKE '%llc%' THEN 'corporate'
-                    WHEN LOWER(company) LIKE '%consulting%' OR LOWER(company) LIKE '%advisory%' THEN 'consulting'
-                    WHEN LOWER(company) LIKE '%university%' OR LOWER(company) LIKE '%education%' THEN 'education'
-                    ELSE 'other'
-                END as company_type,
-                COUNT(*) as count
-            FROM leads 
-            WHERE created_at >= :start_date
-                AND company IS NOT NULL 
-                AND company != ''
-            GROUP BY company_type
-            ORDER BY count DESC
-        """
-        
-        company_types_results = await db.fetch_all(
-            query=company_types_query,
-            values={"start_date": start_date}
-        )
-        
-        # Role analysis
-        role_query = """
-            SELECT 
-                CASE 
-                    WHEN LOWER(role) LIKE '%founder%' OR LOWER(role) LIKE '%ceo%' THEN 'founder'
-                    WHEN LOWER(role) LIKE '%cto%' OR LOWER(role) LIKE '%technical%' THEN 'cto'
-                    WHEN LOWER(role) LIKE '%recruiter%' OR LOWER(role) LIKE '%hr%' THEN 'recruiter'
-                    WHEN LOWER(role) LIKE '%manager%' OR LOWER(role) LIKE '%director%' THEN 'management'
-                    WHEN LOWER(role) LIKE '%engineer%' OR LOWER(role) LIKE '%developer%' THEN 'engineering'
-                    ELSE 'other'
-                END as role_category,
-                COUNT(*) as count
-            FROM leads 
-            WHERE created_at >= :start_date
-                AND role IS NOT NULL 
-                AND role != ''
-            GROUP BY role_category
-            ORDER BY count DESC
+        # All dashboard aggregates in a single round trip. Postgres builds
+        # the AnalyticsResponse JSON itself, so it is passed through as-is.
+        dashboard_query = """
+            WITH portfolio AS (
+                SELECT 
+                    COUNT(*) as total_requests,
+                    COUNT(*) FILTER (WHERE created_at >= $1) as period_requests,
+                    COUNT(*) FILTER (WHERE status = 'qualified') as qualified_leads,
+                    COUNT(*) FILTER (WHERE status IN ('proposal_sent', 'closed_won')) as converted_leads,
+                    COUNT(*) FILTER (WHERE source = 'cv_request') as cv_requests,
+                    COUNT(*) FILTER (WHERE source = 'calendly') as calendly_bookings,
+                    COUNT(*) FILTER (WHERE source = 'linkedin') as linkedin_leads,
+                    COUNT(DISTINCT email) as unique_contacts,
+                    COUNT(*) FILTER (WHERE company IS NOT NULL AND company != '') as with_company
+                FROM leads 
+                WHERE created_at >= $1
+            ),
+            quality AS (
+                SELECT 
+                    company,
+                    role,
+                    status,
+                    COUNT(*) as count
+                FROM leads 
+                WHERE created_at >= $1
+                    AND company IS NOT NULL 
+                    AND company != ''
+                GROUP BY company, role, status
+                ORDER BY count DESC
+                LIMIT 10
+            ),
+            trends AS (
+                SELECT 
+                    DATE_TRUNC('day', created_at) as date,
+                    COUNT(*) as daily_requests,
+                    COUNT(*) FILTER (WHERE source = 'cv_request') as cv_requests,
+                    COUNT(*) FILTER (WHERE source = 'calendly') as calendly_bookings
+                FROM leads 
+                WHERE created_at >= $1
+                GROUP BY DATE_TRUNC('day', created_at)
+                ORDER BY date DESC
+                LIMIT 30
+            ),
+            sources AS (
+                SELECT 
+                    source,
+                    COUNT(*) as count,
+                    ROUND(COUNT(*) * 100.0 / SUM(COUNT(*)) OVER (), 2) as percentage
+                FROM leads 
+                WHERE created_at >= $1
+                GROUP BY source
+                ORDER BY count DESC
+            ),
+            company_types AS (
+                SELECT 
+                    company_type,
+                    COUNT(*) as count
+                FROM leads 
+                WHERE created_at >= $1
+                    AND company_type IS NOT NULL
+                GROUP BY company_type
+                ORDER BY count DESC
+            ),
+            roles AS (
+                SELECT 
+                    role_category,
+                    COUNT(*) as count
+                FROM leads 
+                WHERE created_at >= $1
+                    AND role_category IS NOT NULL
+                GROUP BY role_category
+                ORDER BY count DESC
+            )
+            SELECT json_build_object(
+                'portfolio_metrics', json_build_object(
+                    'cv_requests', json_build_object(
+                        'total', p.total_requests,
+                        'this_period', p.period_requests,
+                        'qualification_rate', COALESCE(ROUND(p.qualified_leads * 100.0 / NULLIF(p.period_requests, 0), 2), 0),
+                        'conversion_rate', COALESCE(ROUND(p.converted_leads * 100.0 / NULLIF(p.period_requests, 0), 2), 0)
+                    ),
+                    'contact_sources', COALESCE(
+                        (SELECT json_object_agg(source, count ORDER BY count DESC) FROM sources), '{}'::json
+                    ),
+                    'unique_contacts', p.unique_contacts,
+                    'daily_trends', COALESCE(
+                        (SELECT json_agg(json_build_object(
+                            'date', date,
+                            'requests', daily_requests,
+                            'cv_requests', cv_requests,
+                            'calendly_bookings', calendly_bookings
+                        ) ORDER BY date DESC) FROM trends), '[]'::json
+                    )
+                ),
+                'lead_quality', json_build_object(
+                    'by_company_type', COALESCE(
+                        (SELECT json_object_agg(company_type, count ORDER BY count DESC) FROM company_types), '{}'::json
+                    ),
+                    'by_role', COALESCE(
+                        (SELECT json_object_agg(role_category, count ORDER BY count DESC) FROM roles), '{}'::json
+                    ),
+                    'top_companies', COALESCE(
+                        (SELECT json_agg(json_build_object(
+                            'company', company,
+                            'count', count,
+                            'status', status
+                        ) ORDER BY count DESC) FROM quality), '[]'::json
+                    )
+                ),
+                'time_period', $2::int || ' days',
+                'generated_at', now()
+            )::text as payload
+            FROM portfolio p
         """
         
-        role_results = await db.fetch_all(
-            query=role_query,
-            values={"start_date": start_date}
-        )
-        
-        # Calculate conversion rates
-        total_requests = portfolio_result["period_requests"] or 0
-        qualified_leads = portfolio_result["qualified_leads"] or 0
-        converted_leads = portfolio_result["converted_leads"] or 0
+        payload = await db.fetchval(dashboard_query, start_date, days)
         
-        qualification_rate = (qualified_leads / total_requests * 100) if total_requests > 0 else 0
-        conversion_rate = (converted_leads / total_requests * 100) if total_requests > 0 else 0
+        await cache_set_raw(cache_key, payload, ttl=settings.ANALYTICS_CACHE_TTL)
         
-        # Build response
-        portfolio_metrics = {
-            "cv_requests": {
-                "total": portfolio_result["total_requests"],
-                "this_period": portfolio_result["period_requests"],
-                "qualification_rate": round(qualification_rate, 2),
-                "conversion_rate": round(conversion_rate, 2)
-            },
-            "contact_sources": {
-                source["source"]: source["count"] 
-                for source in source_results
-            },
-            "unique_contacts": portfolio_result["unique_contacts"],
-            "daily_trends": [
-                {
-                    "date": trend["date"].isoformat(),
-                    "requests": trend["daily_requests"],
-                    "cv_requests": trend["cv_requests"],
-                    "calendly_bookings": trend["calendly_bookings"]
-                }
-                for trend in trends_results
-            ]
-        }
-        
-        lead_quality = {
-            "by_company_type": {
-                company_type["company_type"]: company_type["count"]
-                for company_type in company_types_results
-            },
-            "by_role": {
-                role["role_category"]: role["count"]
-                for role in role_results
-            },
-            "top_companies": [
-                {"company": item["company"], "count": item["count"], "status": item["status"]}
-                for item in quality_results[:10]
-            ]
-        }
-        
-        return AnalyticsResponse(
-            portfolio_metrics=portfolio_metrics,
-            lead_quality=lead_quality,
-            time_period=f"{days} days",
-            generated_at=datetime.utcnow()
-        )
+        return Response(content=payload, media_type="application/json")
         
     except Exception as e:
         raise HTTPException(
@@ -228,15 +177,15 @@ async def get_leads_summary(
         query = """
             SELECT 
                 COUNT(*) as total_leads,
-                COUNT(CASE WHEN status = 'new' THEN 1 END) as new_leads,
-                COUNT(CASE WHEN status = 'qualified' THEN 1 END) as qualified_leads,
-                COUNT(CASE WHEN status = 'closed_won' THEN 1 END) as won_leads,
-                COUNT(CASE WHEN created_at >= CURRENT_DATE - INTERVAL '7 days' THEN 1 END) as this_week,
-                COUNT(CASE WHEN created_at >= CURRENT_DATE - INTERVAL '30 days' THEN 1 END) as this_month
+                COUNT(*) FILTER (WHERE status = 'new') as new_leads,
+                COUNT(*) FILTER (WHERE status = 'qualified') as qualified_leads,
+                COUNT(*) FILTER (WHERE status = 'closed_won') as won_leads,
+                COUNT(*) FILTER (WHERE created_at >= CURRENT_DATE - INTERVAL '7 days') as this_week,
+                COUNT(*) FILTER (WHERE created_at >= CURRENT_DATE - INTERVAL '30 days') as this_month
             FROM leads
         """
         
-        result = await db.fetch_one(query=query)
+        result = await db.fetchrow(query)
         
         return {
             "summary": dict(result),
@@ -261,14 +210,14 @@ async def get_performance_metrics(
         email_query = """
             SELECT 
                 COUNT(*) as total_emails,
-                COUNT(CASE WHEN status = 'sent' THEN 1 END) as sent_emails,
-                COUNT(CASE WHEN status = 'failed' THEN 1 END) as failed_emails,
+                COUNT(*) FILTER (WHERE status = 'sent') as sent_emails,
+                COUNT(*) FILTER (WHERE status = 'failed') as failed_emails,
                 AVG(CASE WHEN status = 'sent' THEN 1.0 ELSE 0.0 END) as delivery_rate
             FROM email_logs
             WHERE sent_at >= CURRENT_DATE - INTERVAL '30 days'
         """
         
-        email_result = await db.fetch_one(query=email_query)
+        email_result = await db.fetchrow(email_query)
         
         # Response time simulation (in production, you'd collect real metrics)
         performance_metrics = {
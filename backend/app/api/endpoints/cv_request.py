@@ -1,17 +1,16 @@
 """CV request endpoint for handling CV download requests."""
 
 from datetime import datetime
-from fastapi import APIRouter, HTTPException, Request, Depends
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Request, Depends
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 import structlog
-import uuid
 
 from app.schemas.cv_request import CVRequest, CVResponse
 from app.services.lead_service import LeadService
 from app.services.email_service import EmailService
-from app.utils.validation import validate_honeypot, validate_request_data
+from app.utils.validation import validate_honeypot
 from app.core.database import get_database
 
 # Initialize rate limiter
@@ -26,12 +25,19 @@ router.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 logger = structlog.get_logger(__name__)
 
 
-@router.post("/request-cv", response_model=CVResponse)
+async def reject_honeypot(request: Request, cv_request: CVRequest) -> None:
+    """Reject requests that filled the hidden honeypot field, before any other work."""
+    if not validate_honeypot(cv_request.website):
+        logger.warning("Honeypot triggered", ip=get_remote_address(request))
+        raise HTTPException(status_code=400, detail="Invalid request")
+
+
+@router.post("/request-cv", response_model=CVResponse, dependencies=[Depends(reject_honeypot)])
 @limiter.limit("3/hour")  # Rate limit: 3 requests per hour per IP
 async def request_cv(
     request: Request,
     cv_request: CVRequest,
-    db = Depends(get_database)
+    background_tasks: BackgroundTasks
 ):
     """
     Process CV request and send CV via email.
@@ -49,35 +55,24 @@ async def request_cv(
         client_ip = get_remote_address(request)
         user_agent = request.headers.get("user-agent", "")
         
-        logger.info(
+        # Debug only: the success log below already carries the lead id and
+        # email, and filter_by_level drops this before rendering in production
+        logger.debug(
             "CV request received",
             ip=client_ip,
             email=cv_request.email,
             company=cv_request.company
         )
         
-        # Validate honeypot (spam protection)
-        if not validate_honeypot(cv_request.website):
-            logger.warning("Honeypot triggered", ip=client_ip)
-            raise HTTPException(status_code=400, detail="Invalid request")
-        
-        # Validate request data
-        validate_request_data(cv_request)
-        
         # Check consent
         if not cv_request.consent:
             raise HTTPException(status_code=400, detail="Consent is required")
         
-        # Generate request ID
-        request_id = str(uuid.uuid4())
-        
         # Initialize services
-        lead_service = LeadService(db)
         email_service = EmailService()
         
         # Create lead record
         lead_data = {
-            "id": request_id,
             "name": cv_request.name,
             "email": cv_request.email,
             "phone": cv_request.phone,
@@ -91,10 +86,12 @@ async def request_cv(
             "consent_timestamp": datetime.utcnow()
         }
         
-        await lead_service.create_lead(lead_data)
+        # Written together with concurrent requests in one batched upsert
+        request_id = await request.app.state.lead_batcher.submit(lead_data)
         
-        # Send CV email
-        await email_service.send_cv_email(
+        # Send CV email after the response; SMTP delivery doesn't block the client
+        background_tasks.add_task(
+            email_service.send_cv_email,
             to_email=cv_request.email,
             name=cv_request.name,
             company=cv_request.company,
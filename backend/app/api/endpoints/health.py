@@ -3,15 +3,19 @@
 from datetime import datetime
 from fastapi import APIRouter, Depends
 import asyncio
-import redis.asyncio as redis
+import time
 
 from app.schemas.common import HealthCheck
 from app.core.database import get_database
-from app.core.config import settings
+from app.core.cache import redis_client
 from app import __version__
 
 router = APIRouter()
 
+# Last dependency probe result, reused by health checks within the window
+HEALTH_CACHE_SECONDS = 2.0
+_last_health = {"ts": 0.0, "database": False, "redis": False}
+
 
 async def check_database_connection(db) -> bool:
     """Check database connectivity."""
@@ -25,9 +29,7 @@ async def check_database_connection(db) -> bool:
 async def check_redis_connection() -> bool:
     """Check Redis connectivity."""
     try:
-        redis_client = redis.from_url(settings.REDIS_URL)
         await redis_client.ping()
-        await redis_client.close()
         return True
     except Exception:
         return False
@@ -44,16 +46,22 @@ async def health_check(db = Depends(get_database)):
     - Redis connection
     - Application version
     """
-    # Run health checks concurrently
-    db_check, redis_check = await asyncio.gather(
-        check_database_connection(db),
-        check_redis_connection(),
-        return_exceptions=True
-    )
+    now = time.monotonic()
+    
+    if now - _last_health["ts"] >= HEALTH_CACHE_SECONDS:
+        # Run health checks concurrently
+        async with asyncio.TaskGroup() as tg:
+            db_task = tg.create_task(check_database_connection(db))
+            redis_task = tg.create_task(check_redis_connection())
+        
+        _last_health.update(
+            ts=now,
+            database=db_task.result() is True,
+            redis=redis_task.result() is True,
+        )
     
-    # Handle exceptions from health checks
-    database_healthy = db_check is True
-    redis_healthy = redis_check is True
+    database_healthy = _last_health["database"]
+    redis_healthy = _last_health["redis"]
     
     # Determine overall status
     status = "healthy" if database_healthy and redis_healthy else "degraded"
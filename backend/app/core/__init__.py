@@ -1,14 +1,14 @@
 """Core application modules."""
 
-from .config import settings
-from .database import database, connect_to_db, close_db_connection
+from .config import settings, get_settings
+from .database import create_pg_pool, get_database
 from .security import create_access_token, decode_access_token
 
 __all__ = [
     "settings",
-    "database", 
-    "connect_to_db",
-    "close_db_connection",
+    "get_settings",
+    "create_pg_pool",
+    "get_database",
     "create_access_token",
     "decode_access_token",
 ]
\ No newline at end of file
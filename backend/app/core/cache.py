@@ -0,0 +1,86 @@
+"""Redis cache client and helpers."""
+
+from typing import Any, Optional, Union
+
+import orjson
+import redis.asyncio as redis
+import structlog
+
+from app.core.config import settings
+
+logger = structlog.get_logger(__name__)
+
+# Shared Redis connection pool and client; connections are opened lazily
+redis_pool = redis.ConnectionPool.from_url(
+    settings.REDIS_URL,
+    max_connections=settings.REDIS_MAX_CONNECTIONS,
+)
+redis_client = redis.Redis(connection_pool=redis_pool)
+
+# Key prefix for cached dashboard analytics, one key per time window
+ANALYTICS_CACHE_PREFIX = "analytics:dash:"
+# Generation counter baked into every analytics key; bumping it orphans the
+# old keys, which then expire with their TTL
+ANALYTICS_GEN_KEY = "analytics:gen"
+
+
+async def cache_get_raw(key: str) -> Optional[bytes]:
+    """Get raw bytes from the cache, or None on miss or Redis failure."""
+    try:
+        return await redis_client.get(key)
+    except Exception as e:
+        logger.warning("Cache read failed", key=key, error=str(e))
+        return None
+
+
+async def cache_set_raw(key: str, value: Union[bytes, str], ttl: int) -> None:
+    """Store raw bytes in the cache with a TTL in seconds."""
+    try:
+        await redis_client.set(key, value, ex=ttl)
+    except Exception as e:
+        logger.warning("Cache write failed", key=key, error=str(e))
+
+
+async def cache_get(key: str) -> Optional[Any]:
+    """Get a JSON value from the cache, or None on miss or Redis failure."""
+    cached = await cache_get_raw(key)
+    if cached is None:
+        return None
+    return orjson.loads(cached)
+
+
+async def cache_set(key: str, value: Any, ttl: int) -> None:
+    """Store a JSON-serializable value in the cache with a TTL in seconds."""
+    await cache_set_raw(key, orjson.dumps(value), ttl=ttl)
+
+
+async def cache_delete(*keys: str) -> None:
+    """Remove keys from the cache."""
+    try:
+        await redis_client.delete(*keys)
+    except Exception as e:
+        logger.warning("Cache delete failed", keys=keys, error=str(e))
+
+
+async def analytics_cache_key(days: int) -> str:
+    """Cache key for the dashboard analytics window under the current generation."""
+    try:
+        generation = int(await redis_client.get(ANALYTICS_GEN_KEY) or 0)
+    except Exception as e:
+        logger.warning("Cache read failed", key=ANALYTICS_GEN_KEY, error=str(e))
+        generation = 0
+    return f"{ANALYTICS_CACHE_PREFIX}{generation}:{days}"
+
+
+async def invalidate_analytics_cache() -> None:
+    """Retire every cached analytics window with a single INCR."""
+    try:
+        await redis_client.incr(ANALYTICS_GEN_KEY)
+    except Exception as e:
+        logger.warning("Cache invalidation failed", key=ANALYTICS_GEN_KEY, error=str(e))
+
+
+async def close_redis_connection():
+    """Close Redis connections."""
+    await redis_client.close()
+    await redis_pool.disconnect()
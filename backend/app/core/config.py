@@ -1,13 +1,16 @@
 """Application configuration management."""
 
-import os
-from typing import List, Optional
-from pydantic import BaseSettings, validator
+from functools import lru_cache
+from typing import List, Optional, Union
+from pydantic import field_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
     """Application settings."""
     
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=True)
+    
     # Application
     APP_NAME: str = "Charles Nwankpa Portfolio API"
     APP_VERSION: str = "1.0.0"
@@ -16,19 +19,33 @@ class Settings(BaseSettings):
     
     # Database
     DATABASE_URL: str
+    DATABASE_POOL_MIN_SIZE: int = 10
+    DATABASE_POOL_MAX_SIZE: int = 50
+    DATABASE_POOL_MAX_INACTIVE_LIFETIME: float = 300.0  # seconds
+    DATABASE_COMMAND_TIMEOUT: float = 60.0  # seconds
+    LEAD_BATCH_MAX_SIZE: int = 100
+    LEAD_BATCH_MAX_DELAY: float = 0.05  # seconds
+    SQLALCHEMY_POOL_SIZE: int = 20
+    SQLALCHEMY_MAX_OVERFLOW: int = 40
+    SQLALCHEMY_POOL_TIMEOUT: int = 10  # seconds
+    SQLALCHEMY_POOL_RECYCLE: int = 1800  # seconds
     
     # Redis
     REDIS_URL: str = "redis://localhost:6379"
+    REDIS_MAX_CONNECTIONS: int = 20
+    ADMIN_CACHE_TTL: int = 60  # seconds
+    ANALYTICS_CACHE_TTL: int = 30  # seconds
     
     # Security
     JWT_SECRET: str
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     
-    # CORS
-    CORS_ORIGINS: List[str] = ["*"]
+    # CORS (JSON list or comma-separated string)
+    CORS_ORIGINS: Union[List[str], str] = ["*"]
     
-    @validator("CORS_ORIGINS", pre=True)
+    @field_validator("CORS_ORIGINS", mode="before")
+    @classmethod
     def assemble_cors_origins(cls, v):
         if isinstance(v, str):
             return [i.strip() for i in v.split(",")]
@@ -61,11 +78,14 @@ class Settings(BaseSettings):
     
     # Monitoring
     SENTRY_DSN: Optional[str] = None
-    
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
+    SENTRY_TRACES_RATE: float = 0.0  # Requests with X-Debug-Trace: 1 are always traced
+
+
+@lru_cache
+def get_settings() -> Settings:
+    """Load settings once per process."""
+    return Settings()
 
 
 # Global settings instance
-settings = Settings()
\ No newline at end of file
+settings = get_settings()
\ No newline at end of file
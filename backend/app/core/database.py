@@ -1,38 +1,70 @@
 """Database connection and session management."""
 
+from typing import AsyncIterator, Optional
+
 import asyncpg
-from databases import Database
-from sqlalchemy import create_engine, MetaData
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from fastapi import Request
+from sqlalchemy import MetaData
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base
 
 from app.core.config import settings
 
-# Database setup
-database = Database(settings.DATABASE_URL)
 metadata = MetaData()
 
-# SQLAlchemy setup for migrations
-engine = create_engine(settings.DATABASE_URL.replace("postgresql://", "postgresql+psycopg2://"))
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# SQLAlchemy async engine for ORM access. Built on first use: requests go
+# through the asyncpg pool, so the engine's own pool isn't opened unless
+# ORM code actually asks for a session.
+_async_engine: Optional[AsyncEngine] = None
+AsyncSessionLocal = async_sessionmaker(expire_on_commit=False, autoflush=False)
 Base = declarative_base()
 
 
-async def get_database() -> Database:
-    """Get database connection."""
-    return database
+def get_async_engine() -> AsyncEngine:
+    """Return the SQLAlchemy async engine, creating it on first call."""
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = create_async_engine(
+            settings.DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://"),
+            pool_size=settings.SQLALCHEMY_POOL_SIZE,
+            max_overflow=settings.SQLALCHEMY_MAX_OVERFLOW,
+            pool_timeout=settings.SQLALCHEMY_POOL_TIMEOUT,
+            pool_recycle=settings.SQLALCHEMY_POOL_RECYCLE,
+            pool_pre_ping=True,
+        )
+    return _async_engine
+
+
+async def get_session() -> AsyncIterator[AsyncSession]:
+    """Get an ORM session for the duration of a request."""
+    async with AsyncSessionLocal(bind=get_async_engine()) as session:
+        yield session
 
 
-async def connect_to_db():
-    """Connect to database."""
-    await database.connect()
+async def dispose_engine():
+    """Close the SQLAlchemy engine's connections, if it was ever created."""
+    global _async_engine
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = None
 
 
-async def close_db_connection():
-    """Close database connection."""
-    await database.disconnect()
+async def create_pg_pool() -> asyncpg.Pool:
+    """Create the asyncpg connection pool shared by all requests."""
+    return await asyncpg.create_pool(
+        settings.DATABASE_URL,
+        min_size=settings.DATABASE_POOL_MIN_SIZE,
+        max_size=settings.DATABASE_POOL_MAX_SIZE,
+        max_inactive_connection_lifetime=settings.DATABASE_POOL_MAX_INACTIVE_LIFETIME,
+        command_timeout=settings.DATABASE_COMMAND_TIMEOUT,
+    )
 
 
-async def get_db_pool():
-    """Get asyncpg connection pool for raw SQL operations."""
-    return await asyncpg.create_pool(settings.DATABASE_URL)
\ No newline at end of file
+async def get_database(request: Request) -> asyncpg.Pool:
+    """
+    Get the shared asyncpg pool created at startup.
+    
+    Queries run through the pool's fetch/fetchrow/fetchval/execute helpers,
+    which hold a connection only for the duration of each query.
+    """
+    return request.app.state.pg_pool
\ No newline at end of file
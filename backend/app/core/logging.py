@@ -0,0 +1,58 @@
+"""Logging configuration."""
+
+import logging
+import logging.handlers
+import queue
+import sys
+from typing import Optional
+
+import structlog
+
+from app.core.config import settings
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def configure_logging() -> None:
+    """
+    Route structlog through stdlib logging behind a queue.
+    
+    Request handlers only enqueue records; a listener thread does the
+    blocking writes to stdout.
+    """
+    global _listener
+    
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(
+        log_queue,
+        logging.StreamHandler(sys.stdout),
+        respect_handler_level=True,
+    )
+    
+    root_logger = logging.getLogger()
+    root_logger.handlers = [logging.handlers.QueueHandler(log_queue)]
+    root_logger.setLevel(logging.DEBUG if settings.DEBUG else logging.INFO)
+    
+    structlog.configure(
+        processors=[
+            structlog.stdlib.filter_by_level,
+            structlog.stdlib.add_logger_name,
+            structlog.stdlib.add_log_level,
+            structlog.processors.TimeStamper(fmt="iso"),
+            structlog.processors.JSONRenderer(),
+        ],
+        logger_factory=structlog.stdlib.LoggerFactory(),
+        wrapper_class=structlog.stdlib.BoundLogger,
+        cache_logger_on_first_use=True,
+    )
+    
+    _listener.start()
+
+
+def shutdown_logging() -> None:
+    """Flush queued log records and stop the listener thread."""
+    global _listener
+    
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -1,8 +1,10 @@
 """Security utilities for authentication and authorization."""
 
+import time
 from datetime import datetime, timedelta
 from typing import Optional
 
+from cachetools import TTLCache
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import HTTPException, status
@@ -12,6 +14,10 @@ from app.core.config import settings
 # Password hashing
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Decoded JWT payloads keyed by token string. An entry may outlive its token
+# by up to the TTL, so expiry is re-checked on every cache hit.
+_token_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash."""
@@ -40,8 +46,13 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
 
 def decode_access_token(token: str) -> dict:
     """Decode and validate JWT token."""
+    payload = _token_cache.get(token)
+    if payload is not None and payload.get("exp", 0) > time.time():
+        return payload
+    
     try:
         payload = jwt.decode(token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM])
+        _token_cache[token] = payload
         return payload
     except JWTError:
         raise HTTPException(
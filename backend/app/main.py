@@ -2,13 +2,19 @@
 
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.middleware.trustedhost import TrustedHostMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 import sentry_sdk
 from sentry_sdk.integrations.fastapi import FastApiIntegration
 
 from app.core.config import settings
-from app.core.database import connect_to_db, close_db_connection
+from app.core.database import create_pg_pool, dispose_engine
+from app.core.cache import close_redis_connection
+from app.core.logging import configure_logging, shutdown_logging
+from app.core.middleware import FastTrustedHostMiddleware
+from app.services.email_service import close_smtp_connection, load_cv_attachment
+from app.services.lead_service import LeadWriteBatcher
 from app.api.endpoints import cv_request, admin, analytics, health
 
 
@@ -16,10 +22,31 @@ from app.api.endpoints import cv_request, admin, analytics, health
 async def lifespan(app: FastAPI):
     """Application lifespan events."""
     # Startup
-    await connect_to_db()
+    configure_logging()
+    app.state.pg_pool = await create_pg_pool()
+    app.state.lead_batcher = LeadWriteBatcher(app.state.pg_pool)
+    app.state.lead_batcher.start()
+    load_cv_attachment()
     yield
     # Shutdown
-    await close_db_connection()
+    await app.state.lead_batcher.stop()
+    await app.state.pg_pool.close()
+    await dispose_engine()
+    await close_redis_connection()
+    await close_smtp_connection()
+    shutdown_logging()
+
+
+def traces_sampler(sampling_context: dict) -> float:
+    """Trace requests that ask for it; sample the rest at SENTRY_TRACES_RATE."""
+    if settings.DEBUG:
+        return 1.0
+    
+    scope = sampling_context.get("asgi_scope") or {}
+    if (b"x-debug-trace", b"1") in scope.get("headers", ()):
+        return 1.0
+    
+    return settings.SENTRY_TRACES_RATE
 
 
 # Initialize Sentry for error tracking
@@ -27,7 +54,8 @@ if settings.SENTRY_DSN:
     sentry_sdk.init(
         dsn=settings.SENTRY_DSN,
         integrations=[FastApiIntegration(auto_enable=True)],
-        traces_sample_rate=0.1,
+        traces_sampler=traces_sampler,
+        profiles_sample_rate=0.0,
     )
 
 # Create FastAPI application
@@ -38,6 +66,7 @@ app = FastAPI(
     docs_url="/docs" if settings.DEBUG else None,
     redoc_url="/redoc" if settings.DEBUG else None,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Add middleware
@@ -50,10 +79,13 @@ app.add_middleware(
 )
 
 app.add_middleware(
-    TrustedHostMiddleware,
+    FastTrustedHostMiddleware,
     allowed_hosts=["*"] if settings.DEBUG else ["charles-ai.up.railway.app", "api.charles-ai.up.railway.app"]
 )
 
+# Compress larger responses (dashboard analytics, lead lists)
+app.add_middleware(GZipMiddleware, minimum_size=512)
+
 # Include routers
 app.include_router(health.router, tags=["Health"])
 app.include_router(cv_request.router, prefix=settings.API_PREFIX, tags=["CV Request"])
@@ -1,9 +1,8 @@
 """Admin user model for dashboard access."""
 
-from sqlalchemy import Column, String, Boolean, TIMESTAMP
+from sqlalchemy import Column, String, Boolean, TIMESTAMP, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
-import uuid
 
 from app.core.database import Base
 
@@ -14,7 +13,7 @@ class Admin(Base):
     __tablename__ = "admins"
     
     # Primary key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     
     # User information
     email = Column(String(255), unique=True, nullable=False, index=True)
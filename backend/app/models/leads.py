@@ -1,9 +1,8 @@
 """Lead model for CV requests and contact management."""
 
-from sqlalchemy import Column, String, Text, Boolean, TIMESTAMP, Enum
-from sqlalchemy.dialects.postgresql import UUID, INET
+from sqlalchemy import CheckConstraint, Column, String, Text, Boolean, TIMESTAMP, Computed, Index, text
+from sqlalchemy.dialects.postgresql import UUID, INET, JSONB
 from sqlalchemy.sql import func
-import uuid
 import enum
 
 from app.core.database import Base
@@ -33,35 +32,98 @@ class Lead(Base):
     """Lead model for storing contact information and CV requests."""
     
     __tablename__ = "leads"
+    __table_args__ = (
+        # Plain strings with CHECKs rather than native enums (migration 010)
+        CheckConstraint(
+            "status IN (" + ", ".join(f"'{s.value}'" for s in LeadStatus) + ")",
+            name="ck_leads_status",
+        ),
+        CheckConstraint(
+            "source IN (" + ", ".join(f"'{s.value}'" for s in LeadSource) + ")",
+            name="ck_leads_source",
+        ),
+        # Names and definitions mirror the SQL migrations exactly
+        # One lead per email; the ON CONFLICT (email) target (migration 005)
+        Index("leads_email_idx", "email", unique=True),
+        # Source filter (migration 001)
+        Index("idx_leads_source", "source"),
+        # Analytics classification breakdowns by time (migration 003)
+        Index("idx_leads_company_type_created_at", "company_type", "created_at"),
+        Index("idx_leads_role_category_created_at", "role_category", "created_at"),
+        # Status/source filters ordered or ranged by created_at (migration 004)
+        Index("idx_leads_status_created_at", "status", "created_at"),
+        Index("idx_leads_source_created_at", "source", "created_at"),
+        # Top companies in a time window (migration 006)
+        Index(
+            "idx_leads_created_at_company",
+            "created_at",
+            "company",
+            postgresql_where=text("company IS NOT NULL AND company <> ''"),
+        ),
+        # New-lead inbox (migration 007)
+        Index(
+            "idx_leads_new_created_at",
+            text("created_at DESC"),
+            postgresql_where=text("status = 'new'"),
+        ),
+        # Keyset pagination and created_at ranges (migration 011)
+        Index("idx_leads_created_at_id", text("created_at DESC"), text("id DESC")),
+        # Parsed user agent lookups (migration 008)
+        Index("idx_leads_user_agent_parsed", "user_agent_parsed", postgresql_using="gin"),
+    )
     
     # Primary key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     
     # Contact information
     name = Column(String(255), nullable=False)
-    email = Column(String(255), nullable=False, index=True)
+    email = Column(String(255), nullable=False)  # Unique via leads_email_idx
     phone = Column(String(50), nullable=False)
     company = Column(String(255), nullable=True)
     role = Column(String(255), nullable=True)
     
     # Request details
     purpose = Column(Text, nullable=True)
-    source = Column(Enum(LeadSource), default=LeadSource.CV_REQUEST, nullable=False)
+    source = Column(String(32), default=LeadSource.CV_REQUEST.value, nullable=False)
     
     # Technical tracking
     ip_address = Column(INET, nullable=True)
     user_agent = Column(Text, nullable=True)
+    user_agent_parsed = Column(JSONB, nullable=True)  # {browser, os, device, bot}
     
     # Consent and compliance
     consent_given = Column(Boolean, default=False, nullable=False)
     consent_timestamp = Column(TIMESTAMP(timezone=True), nullable=True)
     
+    # Analytics classification (generated by Postgres, see migration 003)
+    company_type = Column(String(32), Computed("""
+        CASE
+            WHEN company IS NULL OR company = '' THEN NULL
+            WHEN LOWER(company) LIKE '%startup%' OR LOWER(company) LIKE '%inc%' THEN 'startup'
+            WHEN LOWER(company) LIKE '%corp%' OR LOWER(company) LIKE '%ltd%' OR LOWER(company) LIKE '%llc%' THEN 'corporate'
+            WHEN LOWER(company) LIKE '%consulting%' OR LOWER(company) LIKE '%advisory%' THEN 'consulting'
+            WHEN LOWER(company) LIKE '%university%' OR LOWER(company) LIKE '%education%' THEN 'education'
+            ELSE 'other'
+        END
+    """, persisted=True), nullable=True)
+    role_category = Column(String(32), Computed("""
+        CASE
+            WHEN role IS NULL OR role = '' THEN NULL
+            WHEN LOWER(role) LIKE '%founder%' OR LOWER(role) LIKE '%ceo%' THEN 'founder'
+            WHEN LOWER(role) LIKE '%cto%' OR LOWER(role) LIKE '%technical%' THEN 'cto'
+            WHEN LOWER(role) LIKE '%recruiter%' OR LOWER(role) LIKE '%hr%' THEN 'recruiter'
+            WHEN LOWER(role) LIKE '%manager%' OR LOWER(role) LIKE '%director%' THEN 'management'
+            WHEN LOWER(role) LIKE '%engineer%' OR LOWER(role) LIKE '%developer%' THEN 'engineering'
+            ELSE 'other'
+        END
+    """, persisted=True), nullable=True)
+    
     # Lead management
-    status = Column(Enum(LeadStatus), default=LeadStatus.NEW, nullable=False, index=True)
+    status = Column(String(32), default=LeadStatus.NEW.value, nullable=False)
     notes = Column(Text, nullable=True)
     
     # Timestamps
-    created_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), nullable=False, index=True)
+    created_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     
     def __repr__(self):
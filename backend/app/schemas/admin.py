@@ -3,12 +3,14 @@
 from datetime import datetime
 from typing import Optional
 from uuid import UUID
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict
+
+from .common import Email
 
 
 class AdminBase(BaseModel):
     """Base admin schema."""
-    email: EmailStr
+    email: Email
     username: str
     full_name: str
 
@@ -20,7 +22,7 @@ class AdminCreate(AdminBase):
 
 class AdminUpdate(BaseModel):
     """Admin update schema."""
-    email: Optional[EmailStr] = None
+    email: Optional[Email] = None
     username: Optional[str] = None
     full_name: Optional[str] = None
     password: Optional[str] = None
@@ -29,14 +31,14 @@ class AdminUpdate(BaseModel):
 
 class AdminResponse(AdminBase):
     """Admin response schema."""
+    email: str  # Stored value; re-validating it would fail rows saved under older rules
     id: UUID
     is_active: bool
     is_superuser: bool
     created_at: datetime
     last_login: Optional[datetime] = None
     
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class TokenResponse(BaseModel):
@@ -1,8 +1,44 @@
 """Common schemas for API responses."""
 
+import re
 from datetime import datetime
-from typing import Optional, Any, Dict
-from pydantic import BaseModel
+from functools import lru_cache
+from typing import Annotated, Optional, Any, Dict
+from pydantic import AfterValidator, BaseModel
+
+_EMAIL_RE = re.compile(r"^([^@\s]+)@([^@\s]+\.[^@\s]+)$")
+# Labels are checked in their ASCII (punycode) form, so the TLD may be an
+# xn-- label as well as letters
+_DOMAIN_RE = re.compile(
+    r"^(?:[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?\.)+(?:[a-z]{2,63}|xn--[a-z0-9-]{1,59})$"
+)
+
+
+@lru_cache(maxsize=4096)
+def _valid_domain(domain: str) -> bool:
+    if not domain.isascii():
+        # Internationalised domains are matched after IDNA encoding
+        try:
+            domain = domain.encode("idna").decode("ascii")
+        except UnicodeError:
+            return False
+    return bool(_DOMAIN_RE.match(domain))
+
+
+def _validate_email(value: str) -> str:
+    match = _EMAIL_RE.match(value.strip())
+    if not match:
+        raise ValueError("value is not a valid email address")
+    
+    local, domain = match.group(1), match.group(2).lower()
+    if len(local) > 64 or not _valid_domain(domain):
+        raise ValueError("value is not a valid email address")
+    
+    return f"{local}@{domain}"
+
+
+# Lighter stand-in for EmailStr: syntax check only, domain lowercased
+Email = Annotated[str, AfterValidator(_validate_email)]
 
 
 class ResponseMessage(BaseModel):
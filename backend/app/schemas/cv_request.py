@@ -2,56 +2,30 @@
 
 from datetime import datetime
 from typing import Optional
-from pydantic import BaseModel, EmailStr, validator
+from pydantic import BaseModel, ConfigDict, constr, field_validator, model_validator
+
+from app.utils.validation import contains_suspicious, validate_phone_format
+from .common import Email
 
 
 class CVRequest(BaseModel):
     """CV request input schema."""
     
-    name: str
-    email: EmailStr
-    phone: str
+    name: constr(strip_whitespace=True, min_length=2, max_length=100)
+    email: Email
+    phone: constr(strip_whitespace=True, pattern=r"^\+?[\d\s\-()]{10,20}$")
     company: Optional[str] = None
     role: Optional[str] = None
-    purpose: Optional[str] = None
+    purpose: Optional[constr(max_length=500)] = None
     consent: bool
-    website: str = ""  # Honeypot field
-    
-    @validator("name")
-    def validate_name(cls, v):
-        if not v or len(v.strip()) < 2:
-            raise ValueError("Name must be at least 2 characters long")
-        return v.strip()
-    
-    @validator("phone")
-    def validate_phone(cls, v):
-        if not v or len(v.strip()) < 10:
-            raise ValueError("Phone number must be at least 10 characters long")
-        return v.strip()
-    
-    @validator("purpose")
-    def validate_purpose(cls, v):
-        if v and len(v) > 500:
-            raise ValueError("Purpose must be less than 500 characters")
-        return v
+    website: str = ""  # Honeypot field, checked by the route so rejections stay opaque
     
-    @validator("consent")
-    def validate_consent(cls, v):
-        if not v:
-            raise ValueError("Consent is required")
-        return v
-    
-    @validator("website")
-    def validate_honeypot(cls, v):
-        # Honeypot should be empty
-        return v
-
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "name": "John Smith",
                 "email": "john.smith@company.com",
-                "phone": "+1-555-0123",
+                "phone": "+1-555-010-0123",
                 "company": "Tech Corp",
                 "role": "CTO",
                 "purpose": "Interested in AI consulting for our fintech platform",
@@ -59,6 +33,30 @@ class CVRequest(BaseModel):
                 "website": ""
             }
         }
+    )
+    
+    @field_validator("consent")
+    @classmethod
+    def validate_consent(cls, v):
+        if not v:
+            raise ValueError("Consent is required")
+        return v
+    
+    @field_validator("phone")
+    @classmethod
+    def validate_phone(cls, v):
+        # The pattern only limits the characters; this requires 10-15 digits
+        if not validate_phone_format(v):
+            raise ValueError("Invalid phone number format")
+        return v
+    
+    @model_validator(mode="after")
+    def validate_content(self):
+        # Rejected while parsing, so the route never sees injection attempts
+        for field in (self.name, self.email, self.phone, self.company, self.role, self.purpose):
+            if field and contains_suspicious(field):
+                raise ValueError("Invalid characters detected")
+        return self
 
 
 class CVResponse(BaseModel):
@@ -69,12 +67,13 @@ class CVResponse(BaseModel):
     request_id: str
     timestamp: datetime
     
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "success": True,
                 "message": "CV request processed successfully",
                 "request_id": "123e4567-e89b-12d3-a456-426614174000",
                 "timestamp": "2024-01-15T10:30:00Z"
             }
-        }
\ No newline at end of file
+        }
+    )
\ No newline at end of file
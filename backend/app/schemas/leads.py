@@ -3,15 +3,16 @@
 from datetime import datetime
 from typing import Optional
 from uuid import UUID
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict
 
 from app.models.leads import LeadStatus, LeadSource
+from .common import Email
 
 
 class LeadBase(BaseModel):
     """Base lead schema."""
     name: str
-    email: EmailStr
+    email: Email
     phone: str
     company: Optional[str] = None
     role: Optional[str] = None
@@ -29,7 +30,7 @@ class LeadCreate(LeadBase):
 class LeadUpdate(BaseModel):
     """Lead update schema."""
     name: Optional[str] = None
-    email: Optional[EmailStr] = None
+    email: Optional[Email] = None
     phone: Optional[str] = None
     company: Optional[str] = None
     role: Optional[str] = None
@@ -40,6 +41,7 @@ class LeadUpdate(BaseModel):
 
 class LeadResponse(LeadBase):
     """Lead response schema."""
+    email: str  # Stored value; re-validating it would fail rows saved under older rules
     id: UUID
     status: LeadStatus
     notes: Optional[str] = None
@@ -48,14 +50,20 @@ class LeadResponse(LeadBase):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+class LeadCursor(BaseModel):
+    """Keyset position of the last lead on a page."""
+    created_at: datetime
+    id: UUID
 
 
 class LeadListResponse(BaseModel):
     """Paginated lead list response."""
     leads: list[LeadResponse]
-    total: int
-    page: int
+    total: Optional[int] = None  # None when include_total is false
+    page: Optional[int] = None  # None for cursor-based pages
     size: int
-    pages: int
\ No newline at end of file
+    pages: Optional[int] = None
+    next_cursor: Optional[LeadCursor] = None
\ No newline at end of file
@@ -1,6 +1,6 @@
 """Service layer for business logic."""
 
-from .lead_service import LeadService
+from .lead_service import LeadService, LeadWriteBatcher
 from .email_service import EmailService
 
-__all__ = ["LeadService", "EmailService"]
\ No newline at end of file
+__all__ = ["LeadService", "LeadWriteBatcher", "EmailService"]
\ No newline at end of file
@@ -1,27 +1,183 @@
 """Email service for sending CV and notifications."""
 
+import asyncio
+import html
 import aiosmtplib
-import aiofiles
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.application import MIMEApplication
 from pathlib import Path
-from typing import Optional
+from string import Template
+from typing import Optional, Tuple
 import structlog
 
 from app.core.config import settings
 
 logger = structlog.get_logger(__name__)
 
+# One SMTP session shared by all sends; aiosmtplib.SMTP isn't reentrant
+_smtp_client: Optional[aiosmtplib.SMTP] = None
+_smtp_lock = asyncio.Lock()
+
+# CV attachment as (mtime, bytes); re-read only when the file changes
+_cv_attachment: Optional[Tuple[float, bytes]] = None
+
+
+def load_cv_attachment(path: str = settings.CV_FILE_PATH) -> Optional[bytes]:
+    """Return the CV PDF bytes, reading from disk only if the file changed."""
+    global _cv_attachment
+    
+    try:
+        mtime = Path(path).stat().st_mtime
+    except OSError:
+        logger.warning("CV file not found", path=path)
+        return None
+    
+    if _cv_attachment is None or _cv_attachment[0] != mtime:
+        _cv_attachment = (mtime, Path(path).read_bytes())
+        logger.info("CV file loaded", path=path, size=len(_cv_attachment[1]))
+    
+    return _cv_attachment[1]
+
+# Parsed once at import; only the per-recipient fields are substituted per email
+_CV_EMAIL_HTML = Template("""
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Charles Nwankpa - CV</title>
+    <style>
+        body { font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; line-height: 1.6; margin: 0; padding: 20px; background-color: #f8fafc; }
+        .container { max-width: 600px; margin: 0 auto; background: white; border-radius: 12px; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1); overflow: hidden; }
+        .header { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 30px; text-align: center; }
+        .content { padding: 30px; }
+        .footer { background: #f1f5f9; padding: 20px; text-align: center; font-size: 14px; color: #64748b; }
+        .btn { display: inline-block; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; text-decoration: none; padding: 12px 24px; border-radius: 8px; margin: 10px 5px; }
+        .highlight { background: #f0f9ff; border-left: 4px solid #0ea5e9; padding: 15px; margin: 15px 0; border-radius: 0 8px 8px 0; }
+        ul { padding-left: 0; }
+        li { list-style: none; margin: 8px 0; }
+        li:before { content: "✓"; color: #10b981; font-weight: bold; margin-right: 10px; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>Charles Nwankpa</h1>
+            <p>AI Product Engineer • Applied ML Engineer • RAG Systems Architect</p>
+        </div>
+        
+        <div class="content">
+            <h2>Dear $name,</h2>
+            
+            <p>Thank you for your interest in my AI/ML engineering services$company_text.</p>
+            
+            $purpose_text
+            
+            <p>As requested, please find my CV attached. This document outlines my experience in:</p>
+            
+            <ul>
+                <li>Production ML/AI systems and enterprise architecture</li>
+                <li>RAG architecture and LLM implementation</li>
+                <li>Enterprise-grade solution development</li>
+                <li>Strategic AI consulting and executive training</li>
+                <li>FastAPI, Django, PostgreSQL, and AWS/GCP</li>
+            </ul>
+            
+            <div class="highlight">
+                <p><strong>What sets me apart:</strong> I bridge the gap between AI capability and business value through modular, scalable solutions that grow with your business.</p>
+            </div>
+            
+            <h3>Next Steps:</h3>
+            <p>I'd love to discuss how I can help transform your AI ambitions into production-ready solutions:</p>
+            
+            <div style="text-align: center; margin: 25px 0;">
+                <a href="$calendly_url" class="btn">📅 Book Discovery Call</a>
+                <a href="$linkedin_url" class="btn">💼 Connect on LinkedIn</a>
+            </div>
+            
+            <p>Looking forward to exploring collaboration opportunities with you.</p>
+            
+            <p>Best regards,<br>
+            <strong>Charles Nwankpa</strong><br>
+            AI Product Engineer<br>
+            📍 London, UK</p>
+        </div>
+        
+        <div class="footer">
+            <p>This email was sent in response to your CV request from charles-ai.up.railway.app</p>
+            <p>Available for: Fractional AI/ML engineering • Strategic consulting • Executive training • Full-time opportunities</p>
+        </div>
+    </div>
+</body>
+</html>
+""")
+
+_CV_EMAIL_TEXT = Template("""
+Dear $name,
+
+Thank you for your interest in my AI/ML engineering services$company_text.
+
+${purpose_text}As requested, please find my CV attached. This document outlines my experience in:
+
+• Production ML/AI systems and enterprise architecture
+• RAG architecture and LLM implementation  
+• Enterprise-grade solution development
+• Strategic AI consulting and executive training
+• FastAPI, Django, PostgreSQL, and AWS/GCP
+
+What sets me apart: I bridge the gap between AI capability and business value through modular, scalable solutions that grow with your business.
+
+Next Steps:
+- Book a discovery call: $calendly_url
+- Connect on LinkedIn: $linkedin_url
+- Explore my projects: https://charles-ai.up.railway.app
+
+Looking forward to exploring collaboration opportunities with you.
+
+Best regards,
+Charles Nwankpa
+AI Product Engineer
+📍 London, UK
+
+---
+Available for: Fractional AI/ML engineering • Strategic consulting • Executive training • Full-time opportunities
+""")
+
+
+async def _get_smtp_client(reconnect: bool = False) -> aiosmtplib.SMTP:
+    """Return the shared SMTP client, connecting and logging in if needed."""
+    global _smtp_client
+    
+    if reconnect or _smtp_client is None or not _smtp_client.is_connected:
+        _smtp_client = aiosmtplib.SMTP(
+            hostname=settings.EMAIL_SMTP_HOST,
+            port=settings.EMAIL_SMTP_PORT,
+            start_tls=True,
+            username=settings.EMAIL_SMTP_USER,
+            password=settings.EMAIL_SMTP_PASSWORD,
+        )
+        await _smtp_client.connect()
+    
+    return _smtp_client
+
+
+async def close_smtp_connection():
+    """Close the shared SMTP connection."""
+    global _smtp_client
+    
+    if _smtp_client is not None and _smtp_client.is_connected:
+        try:
+            await _smtp_client.quit()
+        except aiosmtplib.SMTPException as e:
+            logger.warning("Error closing SMTP connection", error=str(e))
+    _smtp_client = None
+
 
 class EmailService:
     """Service for sending emails with CV attachments."""
     
     def __init__(self):
-        self.smtp_host = settings.EMAIL_SMTP_HOST
-        self.smtp_port = settings.EMAIL_SMTP_PORT
-        self.smtp_user = settings.EMAIL_SMTP_USER
-        self.smtp_password = settings.EMAIL_SMTP_PASSWORD
         self.from_email = settings.EMAIL_FROM
         self.from_name = settings.EMAIL_FROM_NAME
     
@@ -31,7 +187,7 @@ class EmailService:
         subject: str,
         html_content: str,
         text_content: Optional[str] = None,
-        attachment_path: Optional[str] = None
+        attachment_bytes: Optional[bytes] = None
     ) -> bool:
         """Send email with optional attachment."""
         try:
@@ -50,11 +206,8 @@ class EmailService:
             message.attach(html_part)
             
             # Add attachment if provided
-            if attachment_path and Path(attachment_path).exists():
-                async with aiofiles.open(attachment_path, mode='rb') as file:
-                    attachment_data = await file.read()
-                
-                attachment = MIMEApplication(attachment_data, _subtype='pdf')
+            if attachment_bytes:
+                attachment = MIMEApplication(attachment_bytes, _subtype='pdf')
                 attachment.add_header(
                     'Content-Disposition',
                     'attachment',
@@ -62,15 +215,15 @@ class EmailService:
                 )
                 message.attach(attachment)
             
-            # Send email
-            await aiosmtplib.send(
-                message,
-                hostname=self.smtp_host,
-                port=self.smtp_port,
-                start_tls=True,
-                username=self.smtp_user,
-                password=self.smtp_password,
-            )
+            # Send email over the shared connection, reconnecting once if the
+            # server dropped it while idle
+            async with _smtp_lock:
+                try:
+                    smtp = await _get_smtp_client()
+                    await smtp.send_message(message)
+                except aiosmtplib.SMTPServerDisconnected:
+                    smtp = await _get_smtp_client(reconnect=True)
+                    await smtp.send_message(message)
             
             logger.info("Email sent successfully", to_email=to_email, subject=subject)
             return True
@@ -100,7 +253,7 @@ class EmailService:
             subject=subject,
             html_content=html_content,
             text_content=text_content,
-            attachment_path=settings.CV_FILE_PATH
+            attachment_bytes=load_cv_attachment()
         )
         
         if success:
@@ -121,78 +274,13 @@ class EmailService:
         company_text = f" at {company}" if company else ""
         purpose_text = f"<p><strong>Your stated purpose:</strong> {purpose}</p>" if purpose else ""
         
-        return f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Charles Nwankpa - CV</title>
-    <style>
-        body {{ font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; line-height: 1.6; margin: 0; padding: 20px; background-color: #f8fafc; }}
-        .container {{ max-width: 600px; margin: 0 auto; background: white; border-radius: 12px; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1); overflow: hidden; }}
-        .header {{ background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 30px; text-align: center; }}
-        .content {{ padding: 30px; }}
-        .footer {{ background: #f1f5f9; padding: 20px; text-align: center; font-size: 14px; color: #64748b; }}
-        .btn {{ display: inline-block; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; text-decoration: none; padding: 12px 24px; border-radius: 8px; margin: 10px 5px; }}
-        .highlight {{ background: #f0f9ff; border-left: 4px solid #0ea5e9; padding: 15px; margin: 15px 0; border-radius: 0 8px 8px 0; }}
-        ul {{ padding-left: 0; }}
-        li {{ list-style: none; margin: 8px 0; }}
-        li:before {{ content: "✓"; color: #10b981; font-weight: bold; margin-right: 10px; }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>Charles Nwankpa</h1>
-            <p>AI Product Engineer • Applied ML Engineer • RAG Systems Architect</p>
-        </div>
-        
-        <div class="content">
-            <h2>Dear {name},</h2>
-            
-            <p>Thank you for your interest in my AI/ML engineering services{company_text}.</p>
-            
-            {purpose_text}
-            
-            <p>As requested, please find my CV attached. This document outlines my experience in:</p>
-            
-            <ul>
-                <li>Production ML/AI systems and enterprise architecture</li>
-                <li>RAG architecture and LLM implementation</li>
-                <li>Enterprise-grade solution development</li>
-                <li>Strategic AI consulting and executive training</li>
-                <li>FastAPI, Django, PostgreSQL, and AWS/GCP</li>
-            </ul>
-            
-            <div class="highlight">
-                <p><strong>What sets me apart:</strong> I bridge the gap between AI capability and business value through modular, scalable solutions that grow with your business.</p>
-            </div>
-            
-            <h3>Next Steps:</h3>
-            <p>I'd love to discuss how I can help transform your AI ambitions into production-ready solutions:</p>
-            
-            <div style="text-align: center; margin: 25px 0;">
-                <a href="{settings.CALENDLY_URL}" class="btn">📅 Book Discovery Call</a>
-                <a href="{settings.LINKEDIN_URL}" class="btn">💼 Connect on LinkedIn</a>
-            </div>
-            
-            <p>Looking forward to exploring collaboration opportunities with you.</p>
-            
-            <p>Best regards,<br>
-            <strong>Charles Nwankpa</strong><br>
-            AI Product Engineer<br>
-            📍 London, UK</p>
-        </div>
-        
-        <div class="footer">
-            <p>This email was sent in response to your CV request from charles-ai.up.railway.app</p>
-            <p>Available for: Fractional AI/ML engineering • Strategic consulting • Executive training • Full-time opportunities</p>
-        </div>
-    </div>
-</body>
-</html>
-        """
+        return _CV_EMAIL_HTML.substitute(
+            name=name,
+            company_text=company_text,
+            purpose_text=purpose_text,
+            calendly_url=settings.CALENDLY_URL,
+            linkedin_url=settings.LINKEDIN_URL,
+        )
     
     def _generate_cv_email_text(
         self,
@@ -205,36 +293,13 @@ class EmailService:
         company_text = f" at {company}" if company else ""
         purpose_text = f"Your stated purpose: {purpose}\\n\\n" if purpose else ""
         
-        return f"""
-Dear {name},
-
-Thank you for your interest in my AI/ML engineering services{company_text}.
-
-{purpose_text}As requested, please find my CV attached. This document outlines my experience in:
-
-• Production ML/AI systems and enterprise architecture
-• RAG architecture and LLM implementation  
-• Enterprise-grade solution development
-• Strategic AI consulting and executive training
-• FastAPI, Django, PostgreSQL, and AWS/GCP
-
-What sets me apart: I bridge the gap between AI capability and business value through modular, scalable solutions that grow with your business.
-
-Next Steps:
-- Book a discovery call: {settings.CALENDLY_URL}
-- Connect on LinkedIn: {settings.LINKEDIN_URL}
-- Explore my projects: https://charles-ai.up.railway.app
-
-Looking forward to exploring collaboration opportunities with you.
-
-Best regards,
-Charles Nwankpa
-AI Product Engineer
-📍 London, UK
-
----
-Available for: Fractional AI/ML engineering • Strategic consulting • Executive training • Full-time opportunities
-        """
+        return _CV_EMAIL_TEXT.substitute(
+            name=name,
+            company_text=company_text,
+            purpose_text=purpose_text,
+            calendly_url=settings.CALENDLY_URL,
+            linkedin_url=settings.LINKEDIN_URL,
+        )
     
     async def send_admin_notification(
         self,
@@ -242,18 +307,22 @@ Available for: Fractional AI/ML engineering • Strategic consulting • Executi
     ) -> bool:
         """Send notification to admin about new CV request."""
         
-        subject = f"New CV Request: {lead_data['name']} ({lead_data.get('company', 'No company')})"
+        def field(key: str, default: str) -> str:
+            # Lead fields are requester-controlled; escape before they reach HTML
+            return html.escape(str(lead_data.get(key) or default))
+        
+        subject = f"New CV Request: {lead_data['name']} ({lead_data.get('company') or 'No company'})"
         
         html_content = f"""
         <h2>New CV Request Received</h2>
-        <p><strong>Name:</strong> {lead_data['name']}</p>
-        <p><strong>Email:</strong> {lead_data['email']}</p>
-        <p><strong>Phone:</strong> {lead_data['phone']}</p>
-        <p><strong>Company:</strong> {lead_data.get('company', 'Not specified')}</p>
-        <p><strong>Role:</strong> {lead_data.get('role', 'Not specified')}</p>
-        <p><strong>Purpose:</strong> {lead_data.get('purpose', 'Not specified')}</p>
-        <p><strong>IP Address:</strong> {lead_data.get('ip_address', 'Unknown')}</p>
-        <p><strong>Timestamp:</strong> {lead_data.get('created_at', 'Unknown')}</p>
+        <p><strong>Name:</strong> {field('name', 'Unknown')}</p>
+        <p><strong>Email:</strong> {field('email', 'Unknown')}</p>
+        <p><strong>Phone:</strong> {field('phone', 'Not specified')}</p>
+        <p><strong>Company:</strong> {field('company', 'Not specified')}</p>
+        <p><strong>Role:</strong> {field('role', 'Not specified')}</p>
+        <p><strong>Purpose:</strong> {field('purpose', 'Not specified')}</p>
+        <p><strong>IP Address:</strong> {field('ip_address', 'Unknown')}</p>
+        <p><strong>Timestamp:</strong> {field('created_at', 'Unknown')}</p>
         """
         
         return await self._send_email(
@@ -1,58 +1,156 @@
 """Lead management service."""
 
+import asyncio
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 import structlog
+from cachetools import TTLCache
 
 from app.models.leads import LeadStatus, LeadSource
+from app.core.cache import invalidate_analytics_cache
+from app.core.config import settings
+from app.utils.user_agent import parse_user_agent
 
 logger = structlog.get_logger(__name__)
 
+# get_lead_analytics results by days; the lock makes concurrent misses
+# share a single query
+_lead_analytics_cache: TTLCache = TTLCache(maxsize=16, ttl=settings.ANALYTICS_CACHE_TTL)
+_lead_analytics_lock = asyncio.Lock()
+
+LEAD_INSERT_COLUMNS = """
+    name, email, phone, company, role, purpose, source,
+    ip_address, user_agent, user_agent_parsed, consent_given, consent_timestamp
+"""
+LEAD_INSERT_ARITY = 12
+
+# status, created_at and updated_at are filled by the column defaults
+
+# Repeat requests from the same email refresh the existing lead
+LEAD_UPSERT_CLAUSE = """
+    ON CONFLICT (email) DO UPDATE SET
+        purpose = EXCLUDED.purpose,
+        ip_address = EXCLUDED.ip_address,
+        user_agent = EXCLUDED.user_agent,
+        user_agent_parsed = EXCLUDED.user_agent_parsed,
+        consent_given = EXCLUDED.consent_given,
+        consent_timestamp = EXCLUDED.consent_timestamp,
+        updated_at = CURRENT_TIMESTAMP
+"""
+
+# Columns served by the admin lead listing (LeadResponse fields)
+LEAD_LIST_COLUMNS = """
+    id, name, email, phone, company, role, purpose, source, status, notes,
+    consent_given, consent_timestamp, created_at, updated_at
+"""
+
+
+def lead_insert_args(lead_data: Dict) -> Tuple:
+    """Positional INSERT arguments for a lead, in LEAD_INSERT_COLUMNS order."""
+    return (
+        lead_data["name"],
+        lead_data["email"],
+        lead_data["phone"],
+        lead_data.get("company"),
+        lead_data.get("role"),
+        lead_data.get("purpose"),
+        lead_data["source"],
+        lead_data.get("ip_address"),
+        lead_data.get("user_agent"),
+        parse_user_agent(lead_data.get("user_agent")),
+        lead_data["consent_given"],
+        lead_data.get("consent_timestamp"),
+    )
+
+
+# Built once so every call sends identical SQL text, which asyncpg's
+# per-connection statement cache turns into a reused prepared statement
+LEAD_INSERT_QUERY = f"""
+    INSERT INTO leads ({LEAD_INSERT_COLUMNS})
+    VALUES ({", ".join(f"${i}" for i in range(1, LEAD_INSERT_ARITY + 1))})
+    {LEAD_UPSERT_CLAUSE}
+    RETURNING id
+"""
+LEAD_BY_EMAIL_QUERY = "SELECT * FROM leads WHERE email = $1"
+
+# Array types for each lead_insert_args field, so one statement text
+# serves every batch size
+_LEAD_ARRAY_TYPES = (
+    "text", "text", "text", "text", "text", "text", "text",
+    "inet", "text", "jsonb", "boolean", "timestamptz",
+)
+LEAD_BATCH_INSERT_QUERY = f"""
+    INSERT INTO leads ({LEAD_INSERT_COLUMNS})
+    SELECT t.*
+    FROM unnest({", ".join(f"${i}::{t}[]" for i, t in enumerate(_LEAD_ARRAY_TYPES, 1))}) AS t
+    {LEAD_UPSERT_CLAUSE}
+    RETURNING id, email
+"""
+
 
 class LeadService:
     """Service for managing leads and CV requests."""
     
+    UPDATABLE_FIELDS = ("name", "email", "phone", "company", "role", "purpose", "status", "notes")
+    MAX_PAGE_SIZE = 100
+    
     def __init__(self, database):
         self.db = database
     
+    async def _invalidate_analytics(self) -> None:
+        """Drop cached dashboard analytics after a lead changes."""
+        _lead_analytics_cache.clear()
+        await invalidate_analytics_cache()
+    
     async def create_lead(self, lead_data: Dict) -> str:
-        """Create a new lead record."""
+        """
+        Create a lead record, or refresh the existing lead for that email.
+        
+        Returns the id of the inserted or updated lead.
+        """
         try:
-            query = """
-                INSERT INTO leads (
-                    id, name, email, phone, company, role, purpose, source,
-                    ip_address, user_agent, consent_given, consent_timestamp,
-                    status, created_at, updated_at
-                ) VALUES (
-                    :id, :name, :email, :phone, :company, :role, :purpose, :source,
-                    :ip_address, :user_agent, :consent_given, :consent_timestamp,
-                    :status, :created_at, :updated_at
-                )
-                RETURNING id
-            """
+            lead_id = await self.db.fetchval(LEAD_INSERT_QUERY, *lead_insert_args(lead_data))
+            await self._invalidate_analytics()
             
-            values = {
-                **lead_data,
-                "status": LeadStatus.NEW.value,
-                "created_at": datetime.utcnow(),
-                "updated_at": datetime.utcnow()
-            }
+            logger.info("Lead created successfully", lead_id=lead_id)
+            return str(lead_id)
             
-            result = await self.db.execute(query=query, values=values)
+        except Exception as e:
+            logger.error("Error creating lead", error=str(e), lead_data=lead_data)
+            raise
+    
+    async def create_leads_bulk(self, leads: List[Dict]) -> Dict[str, str]:
+        """
+        Create or refresh many leads in one statement.
+        
+        Returns a mapping of email to lead id. Leads sharing an email are
+        collapsed to the last one, since one statement can't upsert the
+        same row twice.
+        """
+        if not leads:
+            return {}
+        
+        leads_by_email = {lead_data["email"]: lead_data for lead_data in leads}
+        
+        try:
+            # One array per column; the statement is prepared once and reused
+            columns = zip(*(lead_insert_args(lead_data) for lead_data in leads_by_email.values()))
+            rows = await self.db.fetch(LEAD_BATCH_INSERT_QUERY, *(list(c) for c in columns))
+            await self._invalidate_analytics()
             
-            logger.info("Lead created successfully", lead_id=lead_data["id"])
-            return lead_data["id"]
+            logger.info("Leads created in bulk", count=len(rows))
+            return {row["email"]: str(row["id"]) for row in rows}
             
         except Exception as e:
-            logger.error("Error creating lead", error=str(e), lead_data=lead_data)
+            logger.error("Error creating leads in bulk", error=str(e), count=len(leads))
             raise
     
     async def get_lead_by_id(self, lead_id: str) -> Optional[Dict]:
         """Get lead by ID."""
         try:
-            query = "SELECT * FROM leads WHERE id = :lead_id"
-            result = await self.db.fetch_one(query=query, values={"lead_id": lead_id})
+            query = "SELECT * FROM leads WHERE id = $1"
+            result = await self.db.fetchrow(query, lead_id)
             
             if result:
                 return dict(result)
@@ -65,8 +163,7 @@ class LeadService:
     async def get_lead_by_email(self, email: str) -> Optional[Dict]:
         """Get lead by email address."""
         try:
-            query = "SELECT * FROM leads WHERE email = :email ORDER BY created_at DESC LIMIT 1"
-            result = await self.db.fetch_one(query=query, values={"email": email})
+            result = await self.db.fetchrow(LEAD_BY_EMAIL_QUERY, email)
             
             if result:
                 return dict(result)
@@ -78,73 +175,184 @@ class LeadService:
     
     async def update_lead_status(self, lead_id: str, status: LeadStatus, notes: Optional[str] = None) -> bool:
         """Update lead status and notes."""
+        status_value = status.value
+        
         try:
             query = """
                 UPDATE leads 
-                SET status = :status, notes = :notes, updated_at = :updated_at
-                WHERE id = :lead_id
+                SET status = $2, notes = $3, updated_at = CURRENT_TIMESTAMP
+                WHERE id = $1
             """
             
-            values = {
-                "lead_id": lead_id,
-                "status": status.value,
-                "notes": notes,
-                "updated_at": datetime.utcnow()
-            }
-            
-            await self.db.execute(query=query, values=values)
+            await self.db.execute(query, lead_id, status_value, notes)
+            await self._invalidate_analytics()
             
-            logger.info("Lead status updated", lead_id=lead_id, status=status.value)
+            logger.info("Lead status updated", lead_id=lead_id, status=status_value)
             return True
             
         except Exception as e:
             logger.error("Error updating lead status", error=str(e), lead_id=lead_id)
             raise
     
+    async def update_lead(self, lead_id: str, updates: Dict) -> bool:
+        """
+        Update lead fields in a single statement.
+        
+        Fields missing from ``updates`` (or set to None) keep their current
+        value. Returns False if the lead does not exist.
+        """
+        try:
+            query = """
+                UPDATE leads 
+                SET name = COALESCE($2, name),
+                    email = COALESCE($3, email),
+                    phone = COALESCE($4, phone),
+                    company = COALESCE($5, company),
+                    role = COALESCE($6, role),
+                    purpose = COALESCE($7, purpose),
+                    status = COALESCE($8, status),
+                    notes = COALESCE($9, notes),
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE id = $1
+                RETURNING id
+            """
+            
+            values = [updates.get(field) for field in self.UPDATABLE_FIELDS]
+            
+            result = await self.db.fetchrow(query, lead_id, *values)
+            
+            if result is None:
+                return False
+            await self._invalidate_analytics()
+            
+            logger.info("Lead updated", lead_id=lead_id)
+            return True
+            
+        except Exception as e:
+            logger.error("Error updating lead", error=str(e), lead_id=lead_id)
+            raise
+    
+    async def delete_lead(self, lead_id: str) -> bool:
+        """Delete a lead. Returns False if the lead does not exist."""
+        try:
+            query = "DELETE FROM leads WHERE id = $1 RETURNING id"
+            result = await self.db.fetchrow(query, lead_id)
+            
+            if result is None:
+                return False
+            await self._invalidate_analytics()
+            
+            logger.info("Lead deleted", lead_id=lead_id)
+            return True
+            
+        except Exception as e:
+            logger.error("Error deleting lead", error=str(e), lead_id=lead_id)
+            raise
+    
     async def get_leads(
         self,
         skip: int = 0,
         limit: int = 100,
         status: Optional[LeadStatus] = None,
-        source: Optional[LeadSource] = None
+        source: Optional[LeadSource] = None,
+        cursor_created_at: Optional[datetime] = None,
+        cursor_id: Optional[UUID] = None,
+        include_total: bool = True
     ) -> Dict:
-        """Get paginated list of leads with filters."""
+        """
+        Get paginated list of leads with filters.
+        
+        Pass the previous page's next_cursor as cursor_created_at/cursor_id
+        to page by keyset, which stays fast at any depth. Without a cursor
+        the skip offset is used. With include_total=False the total and
+        pages are None and no rows beyond the page are counted.
+        """
+        # Clamp here too so no caller can request an unbounded page
+        limit = min(max(limit, 1), self.MAX_PAGE_SIZE)
+        skip = max(skip, 0)
+        
         try:
             # Build WHERE clause
             where_conditions = []
-            values = {"skip": skip, "limit": limit}
+            values = []
             
             if status:
-                where_conditions.append("status = :status")
-                values["status"] = status.value
+                values.append(status.value)
+                where_conditions.append(f"status = ${len(values)}")
             
             if source:
-                where_conditions.append("source = :source")
-                values["source"] = source.value
+                values.append(source.value)
+                where_conditions.append(f"source = ${len(values)}")
             
             where_clause = "WHERE " + " AND ".join(where_conditions) if where_conditions else ""
             
-            # Get total count
-            count_query = f"SELECT COUNT(*) as total FROM leads {where_clause}"
-            total_result = await self.db.fetch_one(query=count_query, values=values)
-            total = total_result["total"] if total_result else 0
-            
-            # Get leads
-            query = f"""
-                SELECT * FROM leads {where_clause}
-                ORDER BY created_at DESC
-                LIMIT :limit OFFSET :skip
-            """
+            if cursor_created_at is not None and cursor_id is not None:
+                # Keyset page: seek past the cursor on (created_at, id)
+                page_clause = " AND ".join(
+                    where_conditions + [f"(created_at, id) < (${len(values) + 1}, ${len(values) + 2})"]
+                )
+                query = f"""
+                    SELECT {LEAD_LIST_COLUMNS} FROM leads WHERE {page_clause}
+                    ORDER BY created_at DESC, id DESC
+                    LIMIT ${len(values) + 3}
+                """
+                
+                if include_total:
+                    count_query = f"SELECT COUNT(*) as total FROM leads {where_clause}"
+                    results, total = await asyncio.gather(
+                        self.db.fetch(query, *values, cursor_created_at, cursor_id, limit),
+                        self.db.fetchval(count_query, *values),
+                    )
+                else:
+                    results = await self.db.fetch(query, *values, cursor_created_at, cursor_id, limit)
+                    total = None
+                leads = [dict(row) for row in results]
+                page = None
+            elif not include_total:
+                # The window count visits every matching row, so skip it
+                query = f"""
+                    SELECT {LEAD_LIST_COLUMNS} FROM leads {where_clause}
+                    ORDER BY created_at DESC, id DESC
+                    LIMIT ${len(values) + 1} OFFSET ${len(values) + 2}
+                """
+                results = await self.db.fetch(query, *values, limit, skip)
+                leads = [dict(row) for row in results]
+                total = None
+                page = (skip // limit) + 1
+            else:
+                # Get the page and the total match count in one round trip
+                query = f"""
+                    SELECT {LEAD_LIST_COLUMNS}, COUNT(*) OVER() AS total FROM leads {where_clause}
+                    ORDER BY created_at DESC, id DESC
+                    LIMIT ${len(values) + 1} OFFSET ${len(values) + 2}
+                """
+                
+                results = await self.db.fetch(query, *values, limit, skip)
+                leads = [dict(row) for row in results]
+                
+                if leads:
+                    total = leads[0]["total"]
+                    for lead in leads:
+                        del lead["total"]
+                elif skip > 0:
+                    # Past the last page there are no rows to carry the count
+                    count_query = f"SELECT COUNT(*) as total FROM leads {where_clause}"
+                    total = await self.db.fetchval(count_query, *values)
+                else:
+                    total = 0
+                page = (skip // limit) + 1
             
-            results = await self.db.fetch_all(query=query, values=values)
-            leads = [dict(row) for row in results]
+            next_cursor = None
+            if len(leads) == limit:
+                next_cursor = {"created_at": leads[-1]["created_at"], "id": leads[-1]["id"]}
             
             return {
                 "leads": leads,
                 "total": total,
-                "page": (skip // limit) + 1,
+                "page": page,
                 "size": limit,
-                "pages": (total + limit - 1) // limit
+                "pages": (total + limit - 1) // limit if total is not None else None,
+                "next_cursor": next_cursor
             }
             
         except Exception as e:
@@ -152,26 +360,137 @@ class LeadService:
             raise
     
     async def get_lead_analytics(self, days: int = 30) -> Dict:
-        """Get lead analytics for the specified number of days."""
+        """
+        Get lead analytics for the specified number of days.
+        
+        Results are cached in-process for ANALYTICS_CACHE_TTL seconds and
+        dropped whenever this process writes a lead.
+        """
+        cached = _lead_analytics_cache.get(days)
+        if cached is not None:
+            return cached
+        
+        async with _lead_analytics_lock:
+            # Another caller may have filled the cache while we waited
+            cached = _lead_analytics_cache.get(days)
+            if cached is not None:
+                return cached
+            
+            try:
+                query = """
+                    SELECT 
+                        COUNT(*) as total_leads,
+                        COUNT(*) FILTER (WHERE status = 'qualified') as qualified_leads,
+                        COUNT(*) FILTER (WHERE source = 'cv_request') as cv_requests,
+                        COUNT(*) FILTER (WHERE source = 'calendly') as calendly_bookings,
+                        COUNT(*) FILTER (WHERE company IS NOT NULL) as with_company,
+                        AVG(CASE WHEN created_at >= NOW() - make_interval(days => $1) THEN 1 ELSE 0 END) as recent_rate
+                    FROM leads 
+                    WHERE created_at >= NOW() - make_interval(days => $1)
+                """
+                
+                result = await self.db.fetchrow(query, days)
+                analytics = dict(result) if result else {}
+                _lead_analytics_cache[days] = analytics
+                return analytics
+                
+            except Exception as e:
+                logger.error("Error fetching lead analytics", error=str(e))
+                raise
+
+
+class LeadWriteBatcher:
+    """
+    Coalesce concurrent lead writes into batched upserts.
+    
+    Callers submit a lead and await its id. A background task collects up
+    to ``max_batch`` queued leads, waiting at most ``max_delay`` seconds
+    after the first, and writes them with one INSERT ... SELECT FROM unnest()
+    statement. If that statement fails, the batch is retried row by row so
+    only the failing leads' callers see the error.
+    """
+    
+    def __init__(
+        self,
+        pool,
+        max_batch: int = settings.LEAD_BATCH_MAX_SIZE,
+        max_delay: float = settings.LEAD_BATCH_MAX_DELAY,
+    ):
+        self.pool = pool
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_batch * 10)
+        self._task: Optional[asyncio.Task] = None
+    
+    def start(self) -> None:
+        """Start the background flush task."""
+        self._task = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        """Flush queued leads and stop the background task."""
+        if self._task is None:
+            return
+        await self._queue.put(None)
+        await self._task
+        self._task = None
+    
+    async def submit(self, lead_data: Dict) -> str:
+        """Queue a lead for writing and return its id once stored."""
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((lead_data, future))
+        return await future
+    
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        
+        while True:
+            item = await self._queue.get()
+            if item is None:
+                return
+            
+            batch = [item]
+            deadline = loop.time() + self.max_delay
+            stopping = False
+            
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            
+            await self._flush(batch)
+            
+            if stopping:
+                return
+    
+    async def _flush(self, batch: List[Tuple[Dict, asyncio.Future]]) -> None:
         try:
-            query = """
-                SELECT 
-                    COUNT(*) as total_leads,
-                    COUNT(CASE WHEN status = 'qualified' THEN 1 END) as qualified_leads,
-                    COUNT(CASE WHEN source = 'cv_request' THEN 1 END) as cv_requests,
-                    COUNT(CASE WHEN source = 'calendly' THEN 1 END) as calendly_bookings,
-                    COUNT(CASE WHEN company IS NOT NULL THEN 1 END) as with_company,
-                    AVG(CASE WHEN created_at >= NOW() - INTERVAL '%s days' THEN 1 ELSE 0 END) as recent_rate
-                FROM leads 
-                WHERE created_at >= NOW() - INTERVAL '%s days'
-            """ % (days, days)
-            
-            result = await self.db.fetch_one(query=query)
+            ids = await LeadService(self.pool).create_leads_bulk([lead_data for lead_data, _ in batch])
             
-            if result:
-                return dict(result)
-            return {}
+            for lead_data, future in batch:
+                if not future.done():
+                    future.set_result(ids[lead_data["email"]])
             
-        except Exception as e:
-            logger.error("Error fetching lead analytics", error=str(e))
-            raise
\ No newline at end of file
+        except Exception:
+            # Already logged by create_leads_bulk. One bad row fails the whole
+            # statement, so retry row by row and fail only the rows at fault
+            await self._flush_rows(batch)
+    
+    async def _flush_rows(self, batch: List[Tuple[Dict, asyncio.Future]]) -> None:
+        service = LeadService(self.pool)
+        
+        for lead_data, future in batch:
+            if future.done():
+                continue
+            try:
+                ids = await service.create_leads_bulk([lead_data])
+                future.set_result(ids[lead_data["email"]])
+            except Exception as e:
+                future.set_exception(e)
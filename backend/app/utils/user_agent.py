@@ -0,0 +1,30 @@
+"""User agent parsing for lead analytics."""
+
+from functools import lru_cache
+from typing import Optional
+
+import orjson
+from ua_parser import user_agent_parser
+
+
+@lru_cache(maxsize=1024)
+def parse_user_agent(user_agent: Optional[str]) -> Optional[str]:
+    """
+    Parse a user agent string into the JSON stored in leads.user_agent_parsed.
+    
+    Returns a JSON object with browser, os, device and bot keys, or None
+    when there is no user agent. Results are cached since the same few
+    browser strings account for most requests.
+    """
+    if not user_agent:
+        return None
+    
+    parsed = user_agent_parser.Parse(user_agent)
+    device = parsed["device"]["family"]
+    
+    return orjson.dumps({
+        "browser": parsed["user_agent"]["family"],
+        "os": parsed["os"]["family"],
+        "device": device,
+        "bot": device == "Spider",
+    }).decode()
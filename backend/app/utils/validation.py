@@ -1,10 +1,41 @@
 """Validation utilities for input sanitization and security."""
 
 import re
+from functools import lru_cache
 from typing import Dict, Any
+from uuid import UUID
+from email_validator import EmailNotValidError, validate_email
 from fastapi import HTTPException
 
-from app.schemas.cv_request import CVRequest
+# Compiled once at import; these run on every CV request
+_PHONE_CLEAN_RE = re.compile(r'[^\d+]')
+# Deletes every ASCII character except digits and '+'; a C-level pass
+# instead of the regex engine for the common all-ASCII input
+_PHONE_KEEP = frozenset('0123456789+')
+_PHONE_TRANS = str.maketrans('', '', ''.join(chr(c) for c in range(128) if chr(c) not in _PHONE_KEEP))
+_PHONE_RE = re.compile(r'^(\+?\d{10,15})$')
+_SANITIZE_RE = re.compile(r'[<>"\']')
+_USERNAME_RE = re.compile(r'^[a-zA-Z0-9_]+$')
+_PW_ALPHA_RE = re.compile(r'[A-Za-z]')
+_PW_DIGIT_RE = re.compile(r'\d')
+
+# Script tags, JavaScript URLs, HTML data URLs and iframe tags, in one pass.
+# Tag bodies use [^>\n]* rather than .*? so the opening tag can't backtrack.
+_SUSPICIOUS_RE = re.compile(
+    r'<script[^>\n]*>.*?</script>|javascript:|data:text/html|<iframe[^>\n]*>.*?</iframe>',
+    re.IGNORECASE,
+)
+# Every suspicious pattern starts with one of these literals; clean input
+# (nearly all of it) is rejected by substring checks without running the regex
+_SUSPICIOUS_LITERALS = ('<script', 'javascript:', 'data:text/html', '<iframe')
+
+
+def contains_suspicious(text: str) -> bool:
+    """Return True if text contains script/iframe tags or script URLs."""
+    lowered = text.lower()
+    if not any(literal in lowered for literal in _SUSPICIOUS_LITERALS):
+        return False
+    return _SUSPICIOUS_RE.search(text) is not None
 
 
 def validate_honeypot(honeypot_value: str) -> bool:
@@ -20,9 +51,12 @@ def validate_honeypot(honeypot_value: str) -> bool:
     return honeypot_value == "" or honeypot_value is None
 
 
+@lru_cache(maxsize=4096)
 def validate_email_format(email: str) -> bool:
     """
-    Validate email format using regex.
+    Validate email syntax with email-validator (no DNS lookups).
+    
+    Results are cached, so repeat submitters skip the parse.
     
     Args:
         email: Email address to validate
@@ -30,10 +64,14 @@ def validate_email_format(email: str) -> bool:
     Returns:
         bool: True if valid format
     """
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email) is not None
+    try:
+        validate_email(email, check_deliverability=False)
+        return True
+    except EmailNotValidError:
+        return False
 
 
+@lru_cache(maxsize=4096)
 def validate_phone_format(phone: str) -> bool:
     """
     Validate phone number format.
@@ -45,15 +83,17 @@ def validate_phone_format(phone: str) -> bool:
         bool: True if valid format
     """
     # Remove common separators
-    cleaned_phone = re.sub(r'[^\d+]', '', phone)
+    cleaned_phone = phone.translate(_PHONE_TRANS)
+    if not cleaned_phone.isascii():
+        # Non-ASCII separators or digits need the Unicode-aware regex
+        cleaned_phone = _PHONE_CLEAN_RE.sub('', phone)
     
     # Check if it's a reasonable length (10-15 digits, possibly with country code)
     if len(cleaned_phone) < 10 or len(cleaned_phone) > 15:
         return False
     
     # Basic pattern check (starts with + or digit)
-    pattern = r'^(\+?\d{10,15})$'
-    return re.match(pattern, cleaned_phone) is not None
+    return _PHONE_RE.match(cleaned_phone) is not None
 
 
 def sanitize_string(value: str, max_length: int = 255) -> str:
@@ -74,57 +114,11 @@ def sanitize_string(value: str, max_length: int = 255) -> str:
     sanitized = value.strip()[:max_length]
     
     # Remove potentially harmful characters
-    sanitized = re.sub(r'[<>"\']', '', sanitized)
+    sanitized = _SANITIZE_RE.sub('', sanitized)
     
     return sanitized
 
 
-def validate_request_data(cv_request: CVRequest) -> None:
-    """
-    Comprehensive validation of CV request data.
-    
-    Args:
-        cv_request: CV request object to validate
-        
-    Raises:
-        HTTPException: If validation fails
-    """
-    
-    # Validate required fields
-    if not cv_request.name or len(cv_request.name.strip()) < 2:
-        raise HTTPException(status_code=400, detail="Name must be at least 2 characters long")
-    
-    if not cv_request.email:
-        raise HTTPException(status_code=400, detail="Email is required")
-    
-    if not validate_email_format(cv_request.email):
-        raise HTTPException(status_code=400, detail="Invalid email format")
-    
-    if not cv_request.phone:
-        raise HTTPException(status_code=400, detail="Phone number is required")
-    
-    if not validate_phone_format(cv_request.phone):
-        raise HTTPException(status_code=400, detail="Invalid phone number format")
-    
-    # Validate optional fields
-    if cv_request.purpose and len(cv_request.purpose) > 500:
-        raise HTTPException(status_code=400, detail="Purpose must be less than 500 characters")
-    
-    # Check for suspicious patterns
-    suspicious_patterns = [
-        r'<script.*?>.*?</script>',  # Script tags
-        r'javascript:',  # JavaScript URLs
-        r'data:text/html',  # Data URLs
-        r'<iframe.*?>.*?</iframe>',  # Iframe tags
-    ]
-    
-    all_text = f"{cv_request.name} {cv_request.email} {cv_request.phone} {cv_request.company or ''} {cv_request.role or ''} {cv_request.purpose or ''}"
-    
-    for pattern in suspicious_patterns:
-        if re.search(pattern, all_text, re.IGNORECASE):
-            raise HTTPException(status_code=400, detail="Invalid characters detected")
-
-
 def validate_admin_data(admin_data: Dict[str, Any]) -> None:
     """
     Validate admin user data.
@@ -146,7 +140,7 @@ def validate_admin_data(admin_data: Dict[str, Any]) -> None:
             raise HTTPException(status_code=400, detail="Username must be at least 3 characters long")
         
         # Check for valid username pattern (alphanumeric and underscore only)
-        if not re.match(r'^[a-zA-Z0-9_]+$', username):
+        if not _USERNAME_RE.match(username):
             raise HTTPException(status_code=400, detail="Username can only contain letters, numbers, and underscores")
     
     if 'password' in admin_data:
@@ -155,13 +149,14 @@ def validate_admin_data(admin_data: Dict[str, Any]) -> None:
             raise HTTPException(status_code=400, detail="Password must be at least 8 characters long")
         
         # Check for password complexity
-        if not re.search(r'[A-Za-z]', password) or not re.search(r'\d', password):
+        if not _PW_ALPHA_RE.search(password) or not _PW_DIGIT_RE.search(password):
             raise HTTPException(status_code=400, detail="Password must contain both letters and numbers")
 
 
+@lru_cache(maxsize=1024)
 def is_valid_uuid(uuid_string: str) -> bool:
     """
-    Check if string is a valid UUID.
+    Check if string is a valid UUID in canonical 8-4-4-4-12 form.
     
     Args:
         uuid_string: String to validate
@@ -169,5 +164,9 @@ def is_valid_uuid(uuid_string: str) -> bool:
     Returns:
         bool: True if valid UUID format
     """
-    uuid_pattern = r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$'
-    return re.match(uuid_pattern, uuid_string.lower()) is not None
\ No newline at end of file
+    try:
+        # UUID() also accepts braces, urn: prefixes and missing hyphens;
+        # comparing against its canonical form keeps the hyphenated format
+        return str(UUID(uuid_string)) == uuid_string.lower()
+    except (ValueError, AttributeError, TypeError):
+        return False
\ No newline at end of file
@@ -0,0 +1,10 @@
+-- Covering index for admin authentication
+-- Migration: 002_admin_auth_indexes.sql
+-- Created: 2026-10-14
+
+-- Login looks up active admins by username and only reads id and
+-- hashed_password, so it can be answered by an index-only scan.
+-- Run outside a transaction block (CONCURRENTLY avoids locking admins).
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_admins_username_active
+    ON admins(username) INCLUDE (id, hashed_password)
+    WHERE is_active;
@@ -0,0 +1,31 @@
+-- Precomputed company/role classification for analytics
+-- Migration: 003_lead_classification_columns.sql
+-- Created: 2026-10-14
+
+-- The dashboard used to classify every lead with LOWER()/LIKE on each
+-- request. Store the classification once per row instead.
+ALTER TABLE leads ADD COLUMN company_type VARCHAR(32) GENERATED ALWAYS AS (
+    CASE
+        WHEN company IS NULL OR company = '' THEN NULL
+        WHEN LOWER(company) LIKE '%startup%' OR LOWER(company) LIKE '%inc%' THEN 'startup'
+        WHEN LOWER(company) LIKE '%corp%' OR LOWER(company) LIKE '%ltd%' OR LOWER(company) LIKE '%llc%' THEN 'corporate'
+        WHEN LOWER(company) LIKE '%consulting%' OR LOWER(company) LIKE '%advisory%' THEN 'consulting'
+        WHEN LOWER(company) LIKE '%university%' OR LOWER(company) LIKE '%education%' THEN 'education'
+        ELSE 'other'
+    END
+) STORED;
+
+ALTER TABLE leads ADD COLUMN role_category VARCHAR(32) GENERATED ALWAYS AS (
+    CASE
+        WHEN role IS NULL OR role = '' THEN NULL
+        WHEN LOWER(role) LIKE '%founder%' OR LOWER(role) LIKE '%ceo%' THEN 'founder'
+        WHEN LOWER(role) LIKE '%cto%' OR LOWER(role) LIKE '%technical%' THEN 'cto'
+        WHEN LOWER(role) LIKE '%recruiter%' OR LOWER(role) LIKE '%hr%' THEN 'recruiter'
+        WHEN LOWER(role) LIKE '%manager%' OR LOWER(role) LIKE '%director%' THEN 'management'
+        WHEN LOWER(role) LIKE '%engineer%' OR LOWER(role) LIKE '%developer%' THEN 'engineering'
+        ELSE 'other'
+    END
+) STORED;
+
+CREATE INDEX idx_leads_company_type_created_at ON leads(company_type, created_at);
+CREATE INDEX idx_leads_role_category_created_at ON leads(role_category, created_at);
@@ -0,0 +1,9 @@
+-- Composite indexes for the analytics hot path
+-- Migration: 004_leads_analytics_indexes.sql
+-- Created: 2026-10-14
+
+-- Dashboard aggregates filter on created_at and group by source or status.
+-- idx_leads_created_at (001) already covers the plain range filter.
+-- Run outside a transaction block (CONCURRENTLY avoids locking leads).
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_leads_source_created_at ON leads(source, created_at);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_leads_status_created_at ON leads(status, created_at);
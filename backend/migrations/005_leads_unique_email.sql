@@ -0,0 +1,17 @@
+-- One lead per email address
+-- Migration: 005_leads_unique_email.sql
+-- Created: 2026-10-14
+
+-- CV requests upsert on email (INSERT ... ON CONFLICT (email)), which needs
+-- a unique index. Merge any duplicate emails before running this; to find them:
+--   SELECT email, count(*) FROM leads GROUP BY email HAVING count(*) > 1;
+-- Run outside a transaction block (CONCURRENTLY avoids locking leads).
+--
+-- No IF NOT EXISTS: if the build fails on duplicates, Postgres leaves an
+-- INVALID leads_email_idx behind, and IF NOT EXISTS would then skip the
+-- rebuild silently. Drop it before re-running:
+--   DROP INDEX CONCURRENTLY IF EXISTS leads_email_idx;
+CREATE UNIQUE INDEX CONCURRENTLY leads_email_idx ON leads(email);
+
+-- The plain email index from 001 is now redundant
+DROP INDEX CONCURRENTLY IF EXISTS idx_leads_email;
@@ -0,0 +1,9 @@
+-- Index for the dashboard's top-companies aggregate
+-- Migration: 006_leads_company_index.sql
+-- Created: 2026-10-14
+
+-- Top companies only considers leads with a company in the time window.
+-- Run outside a transaction block (CONCURRENTLY avoids locking leads).
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_leads_created_at_company
+    ON leads(created_at, company)
+    WHERE company IS NOT NULL AND company <> '';
@@ -0,0 +1,13 @@
+-- Partial index for the new-lead inbox
+-- Migration: 007_leads_new_inbox_index.sql
+-- Created: 2026-10-14
+
+-- The admin inbox lists status = 'new' leads newest first.
+-- idx_leads_status_created_at (004) already serves other status filters,
+-- which makes the single-column status index redundant.
+-- Run outside a transaction block (CONCURRENTLY avoids locking leads).
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_leads_new_created_at
+    ON leads(created_at DESC)
+    WHERE status = 'new';
+
+DROP INDEX CONCURRENTLY IF EXISTS idx_leads_status;
@@ -0,0 +1,12 @@
+-- Parsed user agent for lead analytics
+-- Migration: 008_leads_user_agent_parsed.sql
+-- Created: 2026-10-14
+
+-- The application parses user_agent once at insert time into
+-- {browser, os, device, bot}; existing rows stay NULL.
+ALTER TABLE leads ADD COLUMN IF NOT EXISTS user_agent_parsed JSONB;
+
+-- Containment lookups such as user_agent_parsed @> '{"bot": true}'.
+-- Run outside a transaction block (CONCURRENTLY avoids locking leads).
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_leads_user_agent_parsed
+    ON leads USING GIN (user_agent_parsed);
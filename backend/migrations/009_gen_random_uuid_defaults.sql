@@ -0,0 +1,12 @@
+-- Generate primary keys with gen_random_uuid()
+-- Migration: 009_gen_random_uuid_defaults.sql
+-- Created: 2026-10-14
+
+-- gen_random_uuid() is built in from PostgreSQL 13; pgcrypto provides it
+-- on older servers.
+CREATE EXTENSION IF NOT EXISTS pgcrypto;
+
+ALTER TABLE leads ALTER COLUMN id SET DEFAULT gen_random_uuid();
+ALTER TABLE admins ALTER COLUMN id SET DEFAULT gen_random_uuid();
+ALTER TABLE email_logs ALTER COLUMN id SET DEFAULT gen_random_uuid();
+ALTER TABLE analytics_events ALTER COLUMN id SET DEFAULT gen_random_uuid();
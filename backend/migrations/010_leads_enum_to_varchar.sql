@@ -0,0 +1,51 @@
+-- Replace the lead status/source enum types with VARCHAR + CHECK
+-- Migration: 010_leads_enum_to_varchar.sql
+-- Created: 2026-10-14
+
+-- Adding a value to a CHECK constraint is a plain ALTER TABLE, unlike
+-- ALTER TYPE ... ADD VALUE. Rewrites leads, so run it in a quiet window.
+BEGIN;
+
+-- The view and the partial inbox index reference the enum columns
+DROP VIEW IF EXISTS lead_analytics_view;
+DROP INDEX IF EXISTS idx_leads_new_created_at;
+
+ALTER TABLE leads ALTER COLUMN status DROP DEFAULT;
+ALTER TABLE leads ALTER COLUMN source DROP DEFAULT;
+
+ALTER TABLE leads
+    ALTER COLUMN status TYPE VARCHAR(32) USING status::text,
+    ALTER COLUMN source TYPE VARCHAR(32) USING source::text;
+
+ALTER TABLE leads ALTER COLUMN status SET DEFAULT 'new';
+ALTER TABLE leads ALTER COLUMN source SET DEFAULT 'cv_request';
+
+ALTER TABLE leads ADD CONSTRAINT ck_leads_status CHECK (
+    status IN ('new', 'contacted', 'qualified', 'proposal_sent', 'closed_won', 'closed_lost')
+);
+ALTER TABLE leads ADD CONSTRAINT ck_leads_source CHECK (
+    source IN ('cv_request', 'calendly', 'linkedin', 'referral', 'direct', 'other')
+);
+
+DROP TYPE lead_status;
+DROP TYPE lead_source;
+
+CREATE INDEX idx_leads_new_created_at ON leads(created_at DESC) WHERE status = 'new';
+
+CREATE VIEW lead_analytics_view AS
+SELECT 
+    DATE_TRUNC('day', created_at) as date,
+    COUNT(*) as total_leads,
+    COUNT(CASE WHEN status = 'qualified' THEN 1 END) as qualified_leads,
+    COUNT(CASE WHEN source = 'cv_request' THEN 1 END) as cv_requests,
+    COUNT(CASE WHEN company IS NOT NULL THEN 1 END) as with_company
+FROM leads
+GROUP BY DATE_TRUNC('day', created_at)
+ORDER BY date DESC;
+
+-- Primary keys already have a unique index; drop the duplicates that
+-- index=True on the models would create
+DROP INDEX IF EXISTS ix_leads_id;
+DROP INDEX IF EXISTS ix_admins_id;
+
+COMMIT;
@@ -0,0 +1,12 @@
+-- Index for keyset pagination of the admin lead list
+-- Migration: 011_leads_keyset_index.sql
+-- Created: 2026-10-14
+
+-- Pages seek on (created_at, id) < cursor ORDER BY created_at DESC, id DESC.
+-- The index also serves created_at range filters, replacing
+-- idx_leads_created_at (001).
+-- Run outside a transaction block (CONCURRENTLY avoids locking leads).
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_leads_created_at_id
+    ON leads(created_at DESC, id DESC);
+
+DROP INDEX CONCURRENTLY IF EXISTS idx_leads_created_at;
@@ -11,21 +11,20 @@ from datetime import datetime
 
 API_BASE = "http://localhost:8000"
 
-async def test_health_check():
+async def test_health_check(session):
     """Test health check endpoint."""
     print("🏥 Testing health check...")
     
-    async with aiohttp.ClientSession() as session:
-        async with session.get(f"{API_BASE}/health") as response:
-            if response.status == 200:
-                data = await response.json()
-                print(f"✅ Health check passed: {data['status']}")
-                return True
-            else:
-                print(f"❌ Health check failed: {response.status}")
-                return False
+    async with session.get(f"{API_BASE}/health") as response:
+        if response.status == 200:
+            data = await response.json()
+            print(f"✅ Health check passed: {data['status']}")
+            return True
+        else:
+            print(f"❌ Health check failed: {response.status}")
+            return False
 
-async def test_cv_request():
+async def test_cv_request(session):
     """Test CV request endpoint."""
     print("📄 Testing CV request...")
     
@@ -40,26 +39,25 @@ async def test_cv_request():
         "website": ""  # Honeypot
     }
     
-    async with aiohttp.ClientSession() as session:
-        async with session.post(
-            f"{API_BASE}/api/request-cv",
-            json=test_data,
-            headers={"Content-Type": "application/json"}
-        ) as response:
-            if response.status == 200:
-                data = await response.json()
-                print(f"✅ CV request successful: {data['request_id']}")
-                return True
-            elif response.status == 429:
-                print("⚠️  Rate limit hit (expected in testing)")
-                return True
-            else:
-                print(f"❌ CV request failed: {response.status}")
-                text = await response.text()
-                print(f"   Response: {text}")
-                return False
+    async with session.post(
+        f"{API_BASE}/api/request-cv",
+        json=test_data,
+        headers={"Content-Type": "application/json"}
+    ) as response:
+        if response.status == 200:
+            data = await response.json()
+            print(f"✅ CV request successful: {data['request_id']}")
+            return True
+        elif response.status == 429:
+            print("⚠️  Rate limit hit (expected in testing)")
+            return True
+        else:
+            print(f"❌ CV request failed: {response.status}")
+            text = await response.text()
+            print(f"   Response: {text}")
+            return False
 
-async def test_invalid_cv_request():
+async def test_invalid_cv_request(session):
     """Test CV request with invalid data."""
     print("🚫 Testing invalid CV request...")
     
@@ -71,20 +69,19 @@ async def test_invalid_cv_request():
         "website": "spam"  # Honeypot triggered
     }
     
-    async with aiohttp.ClientSession() as session:
-        async with session.post(
-            f"{API_BASE}/api/request-cv",
-            json=invalid_data,
-            headers={"Content-Type": "application/json"}
-        ) as response:
-            if response.status == 400:
-                print("✅ Invalid request properly rejected")
-                return True
-            else:
-                print(f"❌ Invalid request not handled: {response.status}")
-                return False
+    async with session.post(
+        f"{API_BASE}/api/request-cv",
+        json=invalid_data,
+        headers={"Content-Type": "application/json"}
+    ) as response:
+        if response.status == 400:
+            print("✅ Invalid request properly rejected")
+            return True
+        else:
+            print(f"❌ Invalid request not handled: {response.status}")
+            return False
 
-async def test_admin_login():
+async def test_admin_login(session):
     """Test admin login (will fail without proper setup)."""
     print("🔐 Testing admin login...")
     
@@ -93,32 +90,30 @@ async def test_admin_login():
         "password": "admin123"  # Default password from migration
     }
     
-    async with aiohttp.ClientSession() as session:
-        async with session.post(
-            f"{API_BASE}/api/admin/login",
-            json=login_data,
-            headers={"Content-Type": "application/json"}
-        ) as response:
-            if response.status == 200:
-                data = await response.json()
-                print("✅ Admin login successful")
-                return data.get("access_token")
-            else:
-                print(f"⚠️  Admin login failed: {response.status} (expected if no DB)")
-                return None
+    async with session.post(
+        f"{API_BASE}/api/admin/login",
+        json=login_data,
+        headers={"Content-Type": "application/json"}
+    ) as response:
+        if response.status == 200:
+            data = await response.json()
+            print("✅ Admin login successful")
+            return data.get("access_token")
+        else:
+            print(f"⚠️  Admin login failed: {response.status} (expected if no DB)")
+            return None
 
-async def test_docs_endpoint():
+async def test_docs_endpoint(session):
     """Test API documentation endpoint."""
     print("📚 Testing API docs...")
     
-    async with aiohttp.ClientSession() as session:
-        async with session.get(f"{API_BASE}/docs") as response:
-            if response.status == 200:
-                print("✅ API docs accessible")
-                return True
-            else:
-                print(f"⚠️  API docs not accessible: {response.status}")
-                return False
+    async with session.get(f"{API_BASE}/docs") as response:
+        if response.status == 200:
+            print("✅ API docs accessible")
+            return True
+        else:
+            print(f"⚠️  API docs not accessible: {response.status}")
+            return False
 
 async def main():
     """Run all tests."""
@@ -133,16 +128,22 @@ async def main():
         test_admin_login
     ]
     
-    results = []
+    # Independent tests share one session and run concurrently
+    connector = aiohttp.TCPConnector(limit=32, keepalive_timeout=30)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        outcomes = await asyncio.gather(
+            *(test(session) for test in tests),
+            return_exceptions=True
+        )
     
-    for test in tests:
-        try:
-            result = await test()
-            results.append(result)
-        except Exception as e:
-            print(f"❌ Test failed with exception: {e}")
+    results = []
+    for test, outcome in zip(tests, outcomes):
+        if isinstance(outcome, Exception):
+            print(f"❌ {test.__name__} failed with exception: {outcome}")
             results.append(False)
-        print()
+        else:
+            results.append(outcome)
+    print()
     
     # Summary
     print("📊 Test Summary")
@@ -0,0 +1,31 @@
+"""Tests for CV request schema validation."""
+
+import pytest
+from pydantic import ValidationError
+
+from app.schemas.cv_request import CVRequest
+
+
+def make_request(**overrides) -> dict:
+    data = {
+        "name": "John Smith",
+        "email": "john.smith@company.com",
+        "phone": "+1-555-010-0123",
+        "consent": True,
+    }
+    data.update(overrides)
+    return data
+
+
+def test_valid_phone_is_accepted():
+    assert CVRequest(**make_request()).phone == "+1-555-010-0123"
+
+
+@pytest.mark.parametrize("phone", [
+    "((((((((((",  # allowed characters, no digits
+    "123 456 78",  # 8 digits
+    "12345678901234567890",  # 20 digits
+])
+def test_phone_needs_10_to_15_digits(phone):
+    with pytest.raises(ValidationError):
+        CVRequest(**make_request(phone=phone))
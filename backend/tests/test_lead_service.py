@@ -0,0 +1,235 @@
+"""Tests for lead write batching and keyset pagination."""
+
+import asyncio
+from datetime import datetime, timedelta
+from uuid import UUID, uuid5, NAMESPACE_URL
+
+import pytest
+
+from app.models.leads import LeadStatus
+from app.services import lead_service
+from app.services.lead_service import LeadService, LeadWriteBatcher
+
+
+class FakePool:
+    """Records queries and answers the batch insert with one row per email."""
+    
+    def __init__(self, rows=None, error=None, bad_email=None):
+        self.rows = rows or []
+        self.error = error
+        self.bad_email = bad_email
+        self.calls = []
+    
+    async def fetch(self, query, *args):
+        self.calls.append((query, args))
+        if self.error is not None:
+            raise self.error
+        if self.bad_email is not None and self.bad_email in args[1]:
+            raise ValueError(f"bad row: {self.bad_email}")
+        if query is lead_service.LEAD_BATCH_INSERT_QUERY:
+            # Column arrays in LEAD_INSERT_COLUMNS order; email is the second
+            return [{"id": lead_id(email), "email": email} for email in args[1]]
+        return self.rows
+    
+    async def fetchval(self, query, *args):
+        self.calls.append((query, args))
+        return len(self.rows)
+
+
+def lead_id(email: str) -> UUID:
+    return uuid5(NAMESPACE_URL, email)
+
+
+def make_lead(email: str, purpose: str = "Consulting") -> dict:
+    return {
+        "name": "Test Lead",
+        "email": email,
+        "phone": "+15550100123",
+        "company": None,
+        "role": None,
+        "purpose": purpose,
+        "source": "cv_request",
+        "ip_address": "127.0.0.1",
+        "user_agent": None,
+        "consent_given": True,
+        "consent_timestamp": datetime(2026, 1, 1),
+    }
+
+
+def make_rows(count: int) -> list:
+    start = datetime(2026, 1, 31)
+    return [
+        {"id": lead_id(f"row{i}@example.com"), "created_at": start - timedelta(hours=i)}
+        for i in range(count)
+    ]
+
+
+@pytest.fixture(autouse=True)
+def no_redis(monkeypatch):
+    async def invalidate_analytics_cache():
+        pass
+    
+    monkeypatch.setattr(lead_service, "invalidate_analytics_cache", invalidate_analytics_cache)
+
+
+def batch_calls(pool: FakePool) -> list:
+    return [args for query, args in pool.calls if query is lead_service.LEAD_BATCH_INSERT_QUERY]
+
+
+@pytest.mark.asyncio
+async def test_batcher_coalesces_concurrent_submits():
+    pool = FakePool()
+    batcher = LeadWriteBatcher(pool, max_batch=10, max_delay=0.05)
+    batcher.start()
+    
+    emails = [f"lead{i}@example.com" for i in range(5)]
+    ids = await asyncio.gather(*(batcher.submit(make_lead(email)) for email in emails))
+    await batcher.stop()
+    
+    assert ids == [str(lead_id(email)) for email in emails]
+    calls = batch_calls(pool)
+    assert len(calls) == 1
+    assert calls[0][1] == emails
+
+
+@pytest.mark.asyncio
+async def test_batcher_splits_at_max_batch():
+    pool = FakePool()
+    batcher = LeadWriteBatcher(pool, max_batch=2, max_delay=0.05)
+    batcher.start()
+    
+    await asyncio.gather(*(batcher.submit(make_lead(f"lead{i}@example.com")) for i in range(5)))
+    await batcher.stop()
+    
+    assert [len(args[1]) for args in batch_calls(pool)] == [2, 2, 1]
+
+
+@pytest.mark.asyncio
+async def test_batcher_duplicate_emails_share_one_id():
+    pool = FakePool()
+    batcher = LeadWriteBatcher(pool, max_batch=10, max_delay=0.05)
+    batcher.start()
+    
+    first, second = await asyncio.gather(
+        batcher.submit(make_lead("same@example.com", purpose="First")),
+        batcher.submit(make_lead("same@example.com", purpose="Second")),
+    )
+    await batcher.stop()
+    
+    assert first == second == str(lead_id("same@example.com"))
+    (args,) = batch_calls(pool)
+    # One row per email, keeping the last submission
+    assert args[1] == ["same@example.com"]
+    assert args[5] == ["Second"]
+
+
+@pytest.mark.asyncio
+async def test_batcher_flush_failure_reaches_every_waiter():
+    error = RuntimeError("database unavailable")
+    batcher = LeadWriteBatcher(FakePool(error=error), max_batch=10, max_delay=0.05)
+    batcher.start()
+    
+    results = await asyncio.gather(
+        *(batcher.submit(make_lead(f"lead{i}@example.com")) for i in range(3)),
+        return_exceptions=True,
+    )
+    await batcher.stop()
+    
+    assert results == [error, error, error]
+
+
+@pytest.mark.asyncio
+async def test_batcher_bad_row_fails_only_its_waiter():
+    pool = FakePool(bad_email="bad@example.com")
+    batcher = LeadWriteBatcher(pool, max_batch=10, max_delay=0.05)
+    batcher.start()
+    
+    emails = ["lead0@example.com", "bad@example.com", "lead2@example.com"]
+    results = await asyncio.gather(
+        *(batcher.submit(make_lead(email)) for email in emails),
+        return_exceptions=True,
+    )
+    await batcher.stop()
+    
+    assert results[0] == str(lead_id("lead0@example.com"))
+    assert isinstance(results[1], ValueError)
+    assert results[2] == str(lead_id("lead2@example.com"))
+    # The failed batch, then one retry per row
+    assert [args[1] for args in batch_calls(pool)] == [emails] + [[email] for email in emails]
+
+
+@pytest.mark.asyncio
+async def test_batcher_stop_drains_queue():
+    pool = FakePool()
+    # A long delay, so only stop() can end the batch in time
+    batcher = LeadWriteBatcher(pool, max_batch=10, max_delay=30)
+    batcher.start()
+    
+    submits = [asyncio.create_task(batcher.submit(make_lead(f"lead{i}@example.com"))) for i in range(3)]
+    await asyncio.sleep(0)
+    await asyncio.wait_for(batcher.stop(), timeout=1)
+    
+    assert all(task.done() for task in submits)
+    assert [task.result() for task in submits] == [
+        str(lead_id(f"lead{i}@example.com")) for i in range(3)
+    ]
+    assert len(batch_calls(pool)) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_leads_keyset_page():
+    rows = make_rows(2)
+    pool = FakePool(rows=rows)
+    cursor_created_at = datetime(2026, 2, 1)
+    cursor_id = lead_id("cursor@example.com")
+    
+    result = await LeadService(pool).get_leads(
+        limit=2,
+        status=LeadStatus.NEW,
+        cursor_created_at=cursor_created_at,
+        cursor_id=cursor_id,
+        include_total=False,
+    )
+    
+    ((query, args),) = pool.calls
+    assert "WHERE status = $1 AND (created_at, id) < ($2, $3)" in query
+    assert "ORDER BY created_at DESC, id DESC" in query
+    assert "LIMIT $4" in query
+    assert "OFFSET" not in query
+    assert args == (LeadStatus.NEW.value, cursor_created_at, cursor_id, 2)
+    
+    assert result["next_cursor"] == {"created_at": rows[-1]["created_at"], "id": rows[-1]["id"]}
+    assert result["page"] is None
+    assert result["total"] is None
+    assert result["pages"] is None
+
+
+@pytest.mark.asyncio
+async def test_get_leads_keyset_last_page_has_no_cursor():
+    pool = FakePool(rows=make_rows(1))
+    
+    result = await LeadService(pool).get_leads(
+        limit=2,
+        cursor_created_at=datetime(2026, 2, 1),
+        cursor_id=lead_id("cursor@example.com"),
+        include_total=False,
+    )
+    
+    assert result["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_get_leads_without_total_skips_count():
+    pool = FakePool(rows=make_rows(3))
+    
+    result = await LeadService(pool).get_leads(skip=6, limit=3, include_total=False)
+    
+    ((query, args),) = pool.calls
+    assert "COUNT" not in query
+    assert "ORDER BY created_at DESC, id DESC" in query
+    assert args == (3, 6)
+    assert result["total"] is None
+    assert result["pages"] is None
+    assert result["page"] == 3
+    assert result["size"] == 3
+    assert result["next_cursor"]["id"] == make_rows(3)[-1]["id"]